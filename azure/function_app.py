@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Optional
 
 import azure.functions as func
+import orjson
 
 # Import ETL pipeline components
 # Note: Ensure src package is available in Azure Function deployment
@@ -75,7 +76,7 @@ async def http_trigger(req: func.HttpRequest) -> func.HttpResponse:
         result = await run_etl_pipeline(award_codes=award_codes)
 
         return func.HttpResponse(
-            body=json.dumps(result.to_dict()),
+            body=orjson.dumps(result.to_dict()),
             status_code=200,
             mimetype="application/json",
         )
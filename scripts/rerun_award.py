@@ -35,16 +35,15 @@ def delete_previous_jobs_for_award(award_code: str) -> None:
         rows = cur.fetchall()
         job_ids = {r[0] for r in rows}
         if not job_ids:
-            print(f"No previous job steps found referencing award '{award_code}'")
+            logger.info("rerun_award_no_previous_jobs", award=award_code)
             return
-        print(f"Found previous jobs referencing award '{award_code}': {job_ids}. Removing those rows from job_steps and jobs (best-effort).")
         for jid in job_ids:
             cur.execute("DELETE FROM job_steps WHERE job_id = ?", (jid,))
             cur.execute("DELETE FROM jobs WHERE job_id = ?", (jid,))
         conn.commit()
-        print("Deleted previous job records (best-effort).")
+        logger.info("rerun_award_previous_jobs_deleted", award=award_code, job_ids=sorted(job_ids))
     except Exception as e:
-        print("Error while cleaning etl_state DB:", e)
+        logger.error("rerun_award_cleanup_error", award=award_code, error=str(e))
     finally:
         conn.close()
 
@@ -60,14 +59,16 @@ async def run_for_award(award_code: str) -> None:
     await state_manager.initialize()
 
     # Build pipeline and run single award
-    pipeline = ETLPipeline(award_codes=[award_code])
+    pipeline = ETLPipeline(state_manager=state_manager, award_codes=[award_code])
 
     try:
         result = await pipeline.run()
         print("Pipeline completed:")
         print(result.to_dict())
     except Exception as e:
-        print("Pipeline run failed:", e)
+        logger.error("rerun_award_failed", award=award_code, error=str(e))
+    finally:
+        await state_manager.close()
 
 
 def main(argv: Optional[list] = None) -> None:
@@ -81,7 +82,7 @@ def main(argv: Optional[list] = None) -> None:
     try:
         delete_previous_jobs_for_award(award_code)
     except Exception as e:
-        print("Warning: could not clean previous jobs:", e)
+        logger.warning("rerun_award_cleanup_skipped", award=award_code, error=str(e))
 
     asyncio.run(run_for_award(award_code))
 
@@ -64,6 +64,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     try:
         if scheduler and scheduler.is_running:
             scheduler.stop()
+        if state_manager:
+            await state_manager.close()
         logger.info("===== APPLICATION STOPPED =====")
     except Exception as e:
         logger.error(f"Error during shutdown: {e}", exc_info=True)
@@ -64,6 +64,7 @@ class JobListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
 
 
 def get_state_manager() -> StateManager:
@@ -77,13 +78,28 @@ async def list_jobs(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     status: Optional[str] = None,
+    cursor: Optional[str] = None,
     sm: StateManager = Depends(get_state_manager),
 ) -> JobListResponse:
-    """List all ETL jobs with pagination"""
-    # sm = Depends(get_state_manager)
-    offset = (page - 1) * page_size
+    """List all ETL jobs with pagination.
 
-    jobs = await sm.list_jobs(limit=page_size, offset=offset, status=status)
+    Pass the returned ``next_cursor`` as ``cursor`` to page without OFFSET;
+    ``page`` is ignored when a cursor is given.
+    """
+    # sm = Depends(get_state_manager)
+    next_cursor: Optional[str] = None
+    if cursor:
+        try:
+            jobs, next_cursor = await sm.list_jobs_page(
+                limit=page_size, cursor=cursor, status=status
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+    else:
+        offset = (page - 1) * page_size
+        jobs = await sm.list_jobs(limit=page_size, offset=offset, status=status)
+        if len(jobs) == page_size:
+            next_cursor = sm.job_cursor(jobs[-1])
     total = await sm.get_job_count(status=status)
 
     return JobListResponse(
@@ -91,6 +107,7 @@ async def list_jobs(
         total=total,
         page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
     )
 
 
@@ -88,6 +88,10 @@ class Settings(BaseSettings):
         default="0 2 * * *",
         description="Cron expression for ETL schedule (default: 2 AM daily)",
     )
+    scheduler_misfire_grace_time: int = Field(
+        default=3600,
+        description="Seconds a missed scheduled run may be late and still execute on startup",
+    )
 
     # Logging
     log_level: str = Field(
@@ -113,12 +117,40 @@ class Settings(BaseSettings):
         description="Delay between retry attempts in seconds",
     )
 
+    # HTTP connection pool
+    api_max_connections: int = Field(
+        default=64,
+        description="Maximum concurrent connections in the shared API client pool",
+    )
+    api_max_keepalive_connections: int = Field(
+        default=32,
+        description="Maximum idle keep-alive connections kept in the API client pool",
+    )
+    api_keepalive_expiry: float = Field(
+        default=30.0,
+        description="Seconds an idle keep-alive connection is kept open",
+    )
+    api_http2: bool = Field(
+        default=False,
+        description="Use HTTP/2 for API requests (requires the h2 package)",
+    )
+
     # Pagination
     default_page_size: int = Field(
         default=100,
         description="Default page size for API pagination",
     )
 
+    # Transformation
+    transform_parallelism: int = Field(
+        default=1,
+        description="Number of record chunks each transformer converts concurrently in worker threads",
+    )
+    transform_chunk_size: int = Field(
+        default=2048,
+        description="Records per chunk when transforming in parallel",
+    )
+
     @property
     def database_url(self) -> str:
         """Get the database connection URL"""
@@ -1,9 +1,10 @@
 """Pipeline orchestration and execution"""
 
 import asyncio
+import inspect
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 import uuid
 
 from src.core.interfaces import (
@@ -16,6 +17,9 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Called with (step_name, step_result) as soon as a step finishes
+StepCallback = Callable[[str, StepResult], Union[None, Awaitable[None]]]
+
 
 @dataclass
 class PipelineResult:
@@ -75,6 +79,7 @@ class Pipeline:
         self.stop_on_error = stop_on_error
         self._running = False
         self._current_job_id: Optional[str] = None
+        self._step_callbacks: List[StepCallback] = []
 
     def add_step(self, step: PipelineStep) -> "Pipeline":
         """Add a step to the pipeline"""
@@ -86,6 +91,26 @@ class Pipeline:
         self.steps.extend(steps)
         return self
 
+    def on_step_complete(self, callback: StepCallback) -> "Pipeline":
+        """Register a callback invoked after each step finishes (sync or async)"""
+        self._step_callbacks.append(callback)
+        return self
+
+    async def _notify_step_complete(self, step_name: str, step_result: StepResult) -> None:
+        """Run step callbacks; a failing callback never fails the pipeline"""
+        for callback in self._step_callbacks:
+            try:
+                outcome = callback(step_name, step_result)
+                if inspect.isawaitable(outcome):
+                    await outcome
+            except Exception:
+                logger.exception(
+                    "step_callback_error",
+                    pipeline=self.name,
+                    job_id=self._current_job_id,
+                    step=step_name,
+                )
+
     async def execute(
         self,
         context: Optional[PipelineContext] = None,
@@ -130,6 +155,7 @@ class Pipeline:
                 try:
                     step_result = await step.execute(context)
                     result.step_results[step_name] = step_result
+                    await self._notify_step_complete(step_name, step_result)
 
                     if step_result.status == StepStatus.COMPLETED:
                         result.total_records_processed += step_result.records_processed
@@ -171,6 +197,7 @@ class Pipeline:
                         status=StepStatus.FAILED,
                         error_message=str(e),
                     )
+                    await self._notify_step_complete(step_name, result.step_results[step_name])
                     logger.exception(
                         "step_exception",
                         pipeline=self.name,
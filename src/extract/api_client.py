@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 import httpx
+import orjson
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -49,6 +50,10 @@ class APIClient:
         timeout: float = 30.0,
         max_retries: int = 3,
         rate_limit: int = 10,
+        max_connections: int = 64,
+        max_keepalive_connections: int = 32,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
     ):
         settings = get_settings()
         self.base_url = base_url or settings.fwc_api_base_url
@@ -56,6 +61,10 @@ class APIClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.rate_limit = rate_limit
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
 
         # Rate limiting
         self._request_times: List[datetime] = []
@@ -75,10 +84,19 @@ class APIClient:
 
     async def __aenter__(self) -> "APIClient":
         """Async context manager entry"""
+        # One pooled client is shared by every extractor, so size the pool for
+        # concurrent fan-out and keep connections alive between requests.
+        # HTTP/2 requires the optional `h2` package (httpx[http2]).
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
             headers=self.headers,
             timeout=httpx.Timeout(self.timeout),
+            transport=httpx.AsyncHTTPTransport(limits=limits, http2=self.http2, retries=2),
         )
         return self
 
@@ -155,7 +173,9 @@ class APIClient:
                 status_code=response.status_code,
             )
 
-        return response.json()
+        # Pages can be large; orjson parses straight from the body bytes and is
+        # several times faster than the stdlib json behind response.json()
+        return orjson.loads(response.content)
 
     async def get(
         self,
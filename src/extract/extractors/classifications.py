@@ -1,6 +1,6 @@
 """Classifications extractor for FWC API"""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from src.core.interfaces import Extractor, PipelineContext
 from src.extract.api_client import APIClient
@@ -16,7 +16,7 @@ class ClassificationsExtractor(Extractor):
     def __init__(
         self,
         api_client: APIClient,
-        award_codes: Optional[List[str]] = None,
+        award_codes: Optional[Sequence[str]] = None,
         page_size: int = 100,
     ):
         self.api_client = api_client
@@ -1,16 +1,16 @@
 """Bulk loader for efficient database operations"""
 
 from typing import Any, Dict, List, Optional, Type
-import json
 from datetime import datetime
 
+import orjson
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from src.core.interfaces import Loader, PipelineContext
 from src.load.sql_connector import SQLConnector, get_connector
 from src.utils.logging import get_logger
-from src.utils.helpers import chunk_list
+from src.utils.helpers import ichunk
 
 logger = get_logger(__name__)
 
@@ -64,9 +64,9 @@ class BulkLoader(Loader):
         connector = self._get_connector()
         total_loaded = 0
 
-        # Process in batches
-        batches = chunk_list(data, self.batch_size)
-        for batch_num, batch in enumerate(batches, 1):
+        # Process in batches, slicing each one only when it is reached
+        total_batches = -(-len(data) // self.batch_size)
+        for batch_num, batch in enumerate(ichunk(data, self.batch_size), 1):
             try:
                 if self.upsert:
                     loaded = self._upsert_batch(connector, batch)
@@ -78,7 +78,7 @@ class BulkLoader(Loader):
                     "batch_loaded",
                     table=self.table_name,
                     batch=batch_num,
-                    total_batches=len(batches),
+                    total_batches=total_batches,
                     records=loaded,
                 )
             except Exception as e:
@@ -179,7 +179,7 @@ class BulkLoader(Loader):
         clean = {}
         for key, value in record.items():
             if isinstance(value, (dict, list)):
-                clean[key] = json.dumps(value)
+                clean[key] = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
             elif isinstance(value, datetime):
                 clean[key] = value
             else:
@@ -230,7 +230,8 @@ class RawDataLoader(Loader):
                 {
                     "job_id": context.job_id,
                     "data_type": self.data_type,
-                    "response_data": json.dumps(data),
+                    # orjson encodes large raw payloads in C, several times faster than json
+                    "response_data": orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode(),
                     "record_count": len(data),
                     "extracted_at": datetime.utcnow(),
                 },
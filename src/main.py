@@ -63,6 +63,7 @@ async def run_pipeline(award_codes: Optional[List[str]] = None) -> None:
         # Initialize state manager
         state_manager = StateManager()
         await state_manager.initialize()
+        await state_manager.close()
 
         # Run pipeline
         result = await run_etl_pipeline(award_codes=award_codes)
@@ -93,6 +94,7 @@ async def run_with_scheduler() -> None:
     # Initialize state manager
     state_manager = StateManager()
     await state_manager.initialize()
+    await state_manager.close()
 
     # Create scheduler
     scheduler = Scheduler(run_job_func=run_etl_pipeline)
@@ -1,8 +1,8 @@
 """ETL Pipeline orchestrator"""
 
+import hashlib
 import uuid
-from typing import List, Optional
-from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
 
 from src.core.pipeline import Pipeline, PipelineContext, PipelineResult
 from src.extract.api_client import APIClient
@@ -24,10 +24,14 @@ from src.load.bulk_loader import BulkLoader, RawDataLoader
 from src.load.sql_connector import SQLConnector, get_connector
 from src.orchestrator.state_manager import StateManager
 from src.config.settings import get_settings
+from src.utils.helpers import utc_now_iso
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Longer award-code lists are summarized by count + digest in job names
+MAX_NAMED_AWARD_CODES = 5
+
 
 class ETLPipeline:
     """Main ETL Pipeline orchestrator for FWC Modern Awards"""
@@ -37,13 +41,14 @@ class ETLPipeline:
         api_client: Optional[APIClient] = None,
         connector: Optional[SQLConnector] = None,
         state_manager: Optional[StateManager] = None,
-        award_codes: Optional[List[str]] = None,
+        award_codes: Optional[Sequence[str]] = None,
     ):
         self.settings = get_settings()
         self.api_client = api_client
         self.connector = connector or get_connector()
         self.state_manager = state_manager or StateManager()
-        self.award_codes = award_codes
+        # Immutable and hashable, so it can be shared by every extractor and used as a cache key
+        self.award_codes: Optional[Tuple[str, ...]] = tuple(award_codes) if award_codes else None
 
         self._pipeline: Optional[Pipeline] = None
 
@@ -54,6 +59,10 @@ class ETLPipeline:
         return APIClient(
             base_url=self.settings.fwc_api_base_url,
             api_key=self.settings.fwc_api_key,
+            max_connections=self.settings.api_max_connections,
+            max_keepalive_connections=self.settings.api_max_keepalive_connections,
+            keepalive_expiry=self.settings.api_keepalive_expiry,
+            http2=self.settings.api_http2,
         )
 
     def _build_pipeline(self, api_client: APIClient) -> Pipeline:
@@ -73,11 +82,15 @@ class ETLPipeline:
         pipeline.add_step(WageAllowancesExtractor(api_client, self.award_codes, page_size))
 
         # Transform steps
-        pipeline.add_step(AwardsTransformer())
-        pipeline.add_step(ClassificationsTransformer())
-        pipeline.add_step(PayRatesTransformer())
-        pipeline.add_step(ExpenseAllowancesTransformer())
-        pipeline.add_step(WageAllowancesTransformer())
+        transform_options = {
+            "parallelism": self.settings.transform_parallelism,
+            "chunk_size": self.settings.transform_chunk_size,
+        }
+        pipeline.add_step(AwardsTransformer(**transform_options))
+        pipeline.add_step(ClassificationsTransformer(**transform_options))
+        pipeline.add_step(PayRatesTransformer(**transform_options))
+        pipeline.add_step(ExpenseAllowancesTransformer(**transform_options))
+        pipeline.add_step(WageAllowancesTransformer(**transform_options))
 
         # Load steps
         pipeline.add_step(BulkLoader(
@@ -113,30 +126,55 @@ class ETLPipeline:
 
         return pipeline
 
-    async def run(self, job_id: Optional[str] = None) -> PipelineResult:
-        """Run the complete ETL pipeline"""
+    def _job_name(self, award_codes: Optional[Sequence[str]] = None) -> str:
+        """Build a descriptive, bounded-length job name (pipeline + awards + timestamp)"""
+        codes = award_codes if award_codes is not None else self.award_codes
+        if not codes:
+            codes_repr = "all"
+        elif len(codes) <= MAX_NAMED_AWARD_CODES:
+            codes_repr = ",".join(codes)
+        else:
+            digest = hashlib.blake2b(",".join(codes).encode(), digest_size=8).hexdigest()
+            codes_repr = f"{len(codes)}codes_{digest}"
+        return f"fwc_awards_etl:{codes_repr}:{utc_now_iso()}"
+
+    async def run(self, job_id: Optional[str] = None, create_job: bool = True) -> PipelineResult:
+        """Run the complete ETL pipeline.
+
+        Pass ``create_job=False`` when the job record was registered up front
+        (see ``run_awards``); it is then only switched to running.
+        """
         job_id = job_id or str(uuid.uuid4())
 
-        logger.info("etl_pipeline_starting", job_id=job_id)
-
-        # Create job record with a descriptive name (pipeline + awards + timestamp)
-        job_name = f"fwc_awards_etl:{','.join(self.award_codes) if self.award_codes else 'all'}:{datetime.utcnow().isoformat()}"
-        await self.state_manager.create_job(job_id, name=job_name)
+        logger.info(
+            "etl_pipeline_starting",
+            job_id=job_id,
+            award_count=len(self.award_codes) if self.award_codes else None,
+        )
 
-        # Update state
-        await self.state_manager.update_job_status(job_id, "running")
+        if create_job:
+            # Create job record already running
+            await self.state_manager.create_job(job_id, name=self._job_name(), status="running")
+        else:
+            await self.state_manager.update_job_status(job_id, "running")
 
         api_client = await self._create_api_client()
 
         try:
             async with api_client:
                 pipeline = self._build_pipeline(api_client)
+                # Persist each step as it finishes so progress is visible mid-run
+                pipeline.on_step_complete(
+                    lambda step_name, step_result: self.state_manager.save_job_step(
+                        job_id, step_name, step_result
+                    )
+                )
                 context = PipelineContext(job_id=job_id)
 
                 result = await pipeline.execute(context, job_id)
 
-                # Save result to state
-                await self.state_manager.save_job_result(job_id, result)
+                # Steps are already stored; only the job summary remains
+                await self.state_manager.save_job_result(job_id, result, include_steps=False)
 
                 return result
 
@@ -148,16 +186,28 @@ class ETLPipeline:
             raise
 
     async def run_single_award(
-        self, award_code: str, job_id: Optional[str] = None
+        self, award_code: str, job_id: Optional[str] = None, create_job: bool = True
     ) -> PipelineResult:
         """Run ETL for a single award"""
         original_codes = self.award_codes
-        self.award_codes = [award_code]
+        self.award_codes = (award_code,)
         try:
-            return await self.run(job_id)
+            return await self.run(job_id, create_job=create_job)
         finally:
             self.award_codes = original_codes
 
+    async def run_awards(self, award_codes: Sequence[str]) -> List[PipelineResult]:
+        """Run ETL once per award, registering every job in a single transaction first"""
+        specs = [(str(uuid.uuid4()), self._job_name((code,)), "pending") for code in award_codes]
+        await self.state_manager.create_jobs(specs)
+
+        results: List[PipelineResult] = []
+        for (job_id, _, _), award_code in zip(specs, award_codes, strict=True):
+            results.append(
+                await self.run_single_award(award_code, job_id=job_id, create_job=False)
+            )
+        return results
+
 
 async def run_etl_pipeline(
     award_codes: Optional[List[str]] = None,
@@ -165,4 +215,16 @@ async def run_etl_pipeline(
 ) -> PipelineResult:
     """Convenience function to run ETL pipeline"""
     pipeline = ETLPipeline(award_codes=award_codes)
-    return await pipeline.run(job_id)
+    try:
+        return await pipeline.run(job_id)
+    finally:
+        await pipeline.state_manager.close()
+
+
+async def run_etl_sweep(award_codes: List[str]) -> List[PipelineResult]:
+    """Convenience function to run one ETL job per award code"""
+    pipeline = ETLPipeline()
+    try:
+        return await pipeline.run_awards(award_codes)
+    finally:
+        await pipeline.state_manager.close()
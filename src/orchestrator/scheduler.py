@@ -1,9 +1,11 @@
 """Job scheduler using APScheduler"""
 
 from datetime import datetime
-from typing import Callable, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
 import asyncio
 
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
@@ -19,14 +21,50 @@ class Scheduler:
 
     def __init__(self, run_job_func: Optional[Callable] = None):
         self.settings = get_settings()
-        self._scheduler = AsyncIOScheduler()
+        self._scheduler = AsyncIOScheduler(jobstores={"default": self._create_jobstore()})
         self._run_job_func = run_job_func
         self._is_running = False
+        # Jobs registered before start(); the job store is only readable once started
+        self._pending_jobs: Dict[str, Dict[str, Any]] = {}
+
+    def _create_jobstore(self) -> SQLAlchemyJobStore:
+        """Persist scheduled jobs in the state SQLite database so they survive restarts"""
+        db_path = Path(self.settings.sqlite_database_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        return SQLAlchemyJobStore(url=f"sqlite:///{db_path}")
 
     def set_job_function(self, func: Callable) -> None:
         """Set the function to run for scheduled jobs"""
         self._run_job_func = func
 
+    def _add_job(self, job_id: str, **kwargs: Any) -> None:
+        """Add a job, keeping a stored job with the same trigger as it is.
+
+        Re-adding a persisted job would reset its next_run_time and drop a
+        run missed while the process was down, so the stored job is only
+        replaced when its trigger changed.
+        """
+        if not self._is_running:
+            self._pending_jobs[job_id] = kwargs
+            return
+
+        existing = self._scheduler.get_job(job_id)
+        if existing is not None and str(existing.trigger) == str(kwargs["trigger"]):
+            logger.info(
+                "stored_job_kept",
+                job_id=job_id,
+                next_run_time=str(existing.next_run_time),
+            )
+            return
+
+        self._scheduler.add_job(
+            self._run_job_func,
+            id=job_id,
+            replace_existing=True,
+            misfire_grace_time=self.settings.scheduler_misfire_grace_time,
+            **kwargs,
+        )
+
     def add_cron_job(
         self,
         cron_expression: Optional[str] = None,
@@ -50,13 +88,7 @@ class Scheduler:
             day_of_week=parts[4],
         )
 
-        self._scheduler.add_job(
-            self._run_job_func,
-            trigger=trigger,
-            id=job_id,
-            replace_existing=True,
-            name="ETL Pipeline Scheduled Job",
-        )
+        self._add_job(job_id, trigger=trigger, name="ETL Pipeline Scheduled Job")
 
         logger.info(
             "cron_job_added",
@@ -75,13 +107,7 @@ class Scheduler:
 
         trigger = DateTrigger(run_date=run_at)
 
-        self._scheduler.add_job(
-            self._run_job_func,
-            trigger=trigger,
-            id=job_id,
-            replace_existing=True,
-            name="ETL Pipeline One-Time Job",
-        )
+        self._add_job(job_id, trigger=trigger, name="ETL Pipeline One-Time Job")
 
         logger.info(
             "one_time_job_added",
@@ -91,6 +117,9 @@ class Scheduler:
 
     def remove_job(self, job_id: str) -> None:
         """Remove a scheduled job"""
+        if self._pending_jobs.pop(job_id, None) is not None:
+            logger.info("job_removed", job_id=job_id)
+            return
         try:
             self._scheduler.remove_job(job_id)
             logger.info("job_removed", job_id=job_id)
@@ -109,6 +138,9 @@ class Scheduler:
 
         self._scheduler.start()
         self._is_running = True
+        pending, self._pending_jobs = self._pending_jobs, {}
+        for job_id, kwargs in pending.items():
+            self._add_job(job_id, **kwargs)
         logger.info("scheduler_started")
 
     def stop(self) -> None:
@@ -1,37 +1,313 @@
 """State management using SQLite for job tracking"""
 
+import asyncio
+import itertools
+import queue
 import sqlite3
-import aiosqlite
-import json
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 from src.config.settings import get_settings
 from src.core.pipeline import PipelineResult
-from src.core.interfaces import StepStatus
+from src.core.interfaces import StepResult
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# datetime parameters are stored as ISO-8601 text by sqlite3 itself, so callers
+# can bind datetimes (or None) directly
+sqlite3.register_adapter(datetime, datetime.isoformat)
+
+# journal_mode=WAL is persisted in the database file, so it is set once in
+# initialize(); the remaining PRAGMAs are per-connection and applied on connect.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-16000",
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
+# sqlite3 keeps an LRU of prepared statements keyed by SQL text; every query in
+# this module is a constant string, so on the shared connection each is parsed once.
+STATEMENT_CACHE_SIZE = 256
+
+# threadsafety 3 means SQLite was built serialized (SQLITE_THREADSAFE=1), so a
+# connection may be shared across threads and reads can skip the worker queue
+SQLITE_SERIALIZED = sqlite3.threadsafety >= 3
+
+# Read-only connections that serve reads concurrently under WAL
+READ_POOL_SIZE = 4
+
+# Most operations the worker drains from its queue per wakeup (and per transaction)
+WORKER_BATCH_SIZE = 64
+
+# Autocheckpoints never shrink the -wal file; after this many committed
+# operations the worker checkpoints with TRUNCATE to keep it small
+WAL_CHECKPOINT_EVERY = 1000
+
+# add_job_log buffers entries and writes them with one executemany once this
+# many are pending, or after LOG_FLUSH_INTERVAL seconds, whichever comes first
+LOG_FLUSH_SIZE = 256
+LOG_FLUSH_INTERVAL = 0.1
+
+# Rows are fetched as plain tuples and zipped with these column lists, which is
+# cheaper per row than sqlite3.Row + dict(row)
+JOB_COLUMNS = (
+    "id", "job_id", "name", "status", "progress", "total_records", "processed_records",
+    "failed_records", "error_message", "started_at", "completed_at", "created_at", "updated_at",
+)
+JOB_LOG_COLUMNS = ("id", "job_id", "level", "message", "created_at")
+JOB_STEP_COLUMNS = (
+    "id", "job_id", "step_name", "status", "start_time", "end_time", "duration_seconds",
+    "records_processed", "records_failed", "error_message", "created_at",
+)
+_JOB_SELECT = ", ".join(JOB_COLUMNS)
+_JOB_LOG_SELECT = ", ".join(JOB_LOG_COLUMNS)
+_JOB_STEP_SELECT = ", ".join(JOB_STEP_COLUMNS)
+
+
+def _as_dicts(columns: Tuple[str, ...], rows: Any) -> List[Dict[str, Any]]:
+    """Convert tuple rows to dicts keyed by ``columns``"""
+    return [dict(zip(columns, row, strict=True)) for row in rows]
+
+
+def _connect(db_path: str, read_only: bool = False) -> sqlite3.Connection:
+    """Open a connection with the tuned per-connection PRAGMAs applied"""
+    # isolation_level=None: transactions are managed explicitly by the worker
+    conn = sqlite3.connect(
+        db_path,
+        isolation_level=None,
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    if read_only:
+        conn.execute("PRAGMA query_only=ON")
+    return conn
+
+
+def _resolve(future: asyncio.Future, result: Any, error: Optional[BaseException]) -> None:
+    """Complete a worker future on its event loop (skipping cancelled callers)"""
+    if future.cancelled():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+class _Op(NamedTuple):
+    """A queued unit of work for the SQLite worker"""
+
+    fn: Callable[[sqlite3.Connection], Any]
+    transactional: bool
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+
+
+_STOP = object()
+
+
+class _SqliteWorker:
+    """Own a sqlite3 connection on one dedicated thread.
+
+    Operations are queued FIFO. Each wakeup drains up to ``WORKER_BATCH_SIZE``
+    pending operations and runs them in a single transaction, with a savepoint
+    per operation so a failing one is rolled back without affecting the rest.
+    Callers are resolved only after the batch commits.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._ops_since_checkpoint = 0
+        self._thread = threading.Thread(
+            target=self._serve, name="state-db-worker", daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self, fn: Callable[[sqlite3.Connection], Any], transactional: bool = True
+    ) -> "asyncio.Future[Any]":
+        """Queue ``fn(conn)`` and return a future for its result.
+
+        Non-transactional operations (e.g. ``executescript`` or changing the
+        journal mode) run on their own, outside any batch transaction.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.put(_Op(fn, transactional, loop, future))
+        return future
+
+    async def stop(self) -> None:
+        """Finish queued operations, then close the connection and thread"""
+        self._queue.put(_STOP)
+        await asyncio.to_thread(self._thread.join)
+
+    def _serve(self) -> None:
+        """Worker loop: block for one operation, then drain whatever else is queued"""
+        conn = _connect(self.db_path)
+        try:
+            pending: Any = None
+            while True:
+                item = pending if pending is not None else self._queue.get()
+                pending = None
+                if item is _STOP:
+                    return
+                if not item.transactional:
+                    self._run_alone(conn, item)
+                    continue
+
+                batch = [item]
+                while len(batch) < WORKER_BATCH_SIZE:
+                    try:
+                        nxt = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if nxt is _STOP or not nxt.transactional:
+                        pending = nxt
+                        break
+                    batch.append(nxt)
+                self._run_batch(conn, batch)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _run_alone(conn: sqlite3.Connection, op: _Op) -> None:
+        """Run an operation outside of a batch transaction"""
+        try:
+            result, error = op.fn(conn), None
+        except BaseException as exc:
+            result, error = None, exc
+        op.loop.call_soon_threadsafe(_resolve, op.future, result, error)
+
+    def _run_batch(self, conn: sqlite3.Connection, batch: List[_Op]) -> None:
+        """Run a batch of operations in one transaction"""
+        outcomes: List[Tuple[Any, Optional[BaseException]]] = []
+        try:
+            # Take the write lock up front so no statement hits SQLITE_BUSY mid-batch
+            conn.execute("BEGIN IMMEDIATE")
+            for op in batch:
+                conn.execute("SAVEPOINT op")
+                try:
+                    result = op.fn(conn)
+                except Exception as exc:
+                    conn.execute("ROLLBACK TO op")
+                    outcomes.append((None, exc))
+                else:
+                    outcomes.append((result, None))
+                conn.execute("RELEASE op")
+            conn.execute("COMMIT")
+        except Exception as exc:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            outcomes = [(None, exc)] * len(batch)
+
+        for op, (result, error) in zip(batch, outcomes, strict=True):
+            op.loop.call_soon_threadsafe(_resolve, op.future, result, error)
+
+        self._ops_since_checkpoint += len(batch)
+        if self._ops_since_checkpoint >= WAL_CHECKPOINT_EVERY:
+            self._ops_since_checkpoint = 0
+            self._checkpoint(conn)
+
+    def _checkpoint(self, conn: sqlite3.Connection) -> None:
+        """Checkpoint the WAL and truncate it to zero bytes"""
+        try:
+            busy, wal_pages, moved = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+        except sqlite3.Error:
+            logger.exception("wal_checkpoint_failed", db_path=self.db_path)
+            return
+        logger.debug(
+            "wal_checkpoint", db_path=self.db_path, busy=bool(busy), pages=wal_pages, moved=moved
+        )
+
 
 class StateManager:
-    """Manage ETL pipeline state using SQLite"""
+    """Manage ETL pipeline state using SQLite.
+
+    Writes run on a dedicated worker thread that owns a single connection,
+    started on first use. When the SQLite build allows it, reads run in threads
+    on a small pool of read-only connections. Call ``close()`` when the manager
+    is no longer needed.
+    """
 
     def __init__(self, db_path: Optional[str] = None):
         settings = get_settings()
         self.db_path = db_path or settings.sqlite_database_path
         self._ensure_db_dir()
+        self._worker: Optional[_SqliteWorker] = None
+        self._readers: List[sqlite3.Connection] = []
+        self._reader_cycle: Optional[Iterator[sqlite3.Connection]] = None
+        self._log_buf: List[Tuple[str, str, str]] = []
+        self._log_flush_task: Optional[asyncio.Task] = None
 
     def _ensure_db_dir(self) -> None:
         """Ensure database directory exists"""
         path = Path(self.db_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
+    async def _submit(
+        self, fn: Callable[[sqlite3.Connection], Any], transactional: bool = True
+    ) -> Any:
+        """Run ``fn(conn)`` on the worker thread, starting it on first use"""
+        if self._worker is None:
+            self._worker = _SqliteWorker(self.db_path)
+        return await self._worker.submit(fn, transactional)
+
+    async def _execute(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        """Execute one statement and return all of its rows"""
+        return await self._submit(lambda conn: conn.execute(sql, params).fetchall())
+
+    async def _read(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        """Run a read-only query and return all of its rows.
+
+        Under WAL readers never wait for the writer, so when SQLite is serialized
+        the query runs in a thread on the next pooled read connection; otherwise
+        it is queued on the worker like any other operation.
+        """
+        if not SQLITE_SERIALIZED:
+            return await self._execute(sql, params)
+        reader = self._next_reader()
+        return await asyncio.to_thread(lambda: reader.execute(sql, params).fetchall())
+
+    def _next_reader(self) -> sqlite3.Connection:
+        """Pick a read connection round-robin, opening the pool on first use"""
+        if self._reader_cycle is None:
+            self._readers = [_connect(self.db_path, read_only=True) for _ in range(READ_POOL_SIZE)]
+            self._reader_cycle = itertools.cycle(self._readers)
+        return next(self._reader_cycle)
+
+    async def _executemany(self, sql: str, seq_of_params: Sequence[Sequence[Any]]) -> None:
+        """Execute one statement for every parameter set"""
+        await self._submit(lambda conn: conn.executemany(sql, seq_of_params))
+
+    async def close(self) -> None:
+        """Write any buffered logs, then stop the worker thread and close the connections"""
+        if self._log_flush_task is not None:
+            self._log_flush_task.cancel()
+            self._log_flush_task = None
+        await self.flush_logs()
+        if self._worker is not None:
+            worker, self._worker = self._worker, None
+            await worker.stop()
+        for reader in self._readers:
+            reader.close()
+        self._readers = []
+        self._reader_cycle = None
+        logger.debug("state_db_closed", db_path=self.db_path)
+
     async def initialize(self):
         """Initialize SQLite database with required tables"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.executescript(
+
+        def init_schema(conn: sqlite3.Connection) -> None:
+            # WAL lets readers proceed during writes and needs fewer fsyncs per commit
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS jobs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -75,57 +351,110 @@ class StateManager:
 
                 CREATE INDEX IF NOT EXISTS idx_jobs_job_id ON jobs(job_id);
                 CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
+                -- Job listings page newest-first (optionally by status) with id as the
+                -- tie-breaker; a backward scan of these indexes needs no sort step
+                DROP INDEX IF EXISTS idx_jobs_status_created;
+                DROP INDEX IF EXISTS idx_jobs_created;
+                CREATE INDEX IF NOT EXISTS idx_jobs_status_created_id ON jobs(status, created_at, id);
+                CREATE INDEX IF NOT EXISTS idx_jobs_created_id ON jobs(created_at, id);
                 CREATE INDEX IF NOT EXISTS idx_job_logs_job_id ON job_logs(job_id);
                 CREATE INDEX IF NOT EXISTS idx_job_steps_job_id ON job_steps(job_id);
+
+                -- Per-day job counts by status, kept current by the triggers below
+                -- so get_recent_job_stats never has to scan the jobs table
+                CREATE TABLE IF NOT EXISTS job_stats_daily (
+                    day TEXT NOT NULL,
+                    status TEXT,
+                    count INTEGER NOT NULL DEFAULT 0,
+                    sum_records INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (day, status)
+                );
+
+                CREATE TRIGGER IF NOT EXISTS trg_job_stats_insert AFTER INSERT ON jobs
+                BEGIN
+                    INSERT INTO job_stats_daily (day, status, count, sum_records)
+                    VALUES (date(NEW.created_at), NEW.status, 1, COALESCE(NEW.total_records, 0))
+                    ON CONFLICT(day, status) DO UPDATE SET
+                        count = count + 1,
+                        sum_records = sum_records + excluded.sum_records;
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_job_stats_update
+                AFTER UPDATE OF status, total_records, created_at ON jobs
+                WHEN OLD.status IS NOT NEW.status
+                    OR OLD.total_records IS NOT NEW.total_records
+                    OR OLD.created_at IS NOT NEW.created_at
+                BEGIN
+                    UPDATE job_stats_daily
+                    SET count = count - 1,
+                        sum_records = sum_records - COALESCE(OLD.total_records, 0)
+                    WHERE day = date(OLD.created_at) AND status IS OLD.status;
+                    INSERT INTO job_stats_daily (day, status, count, sum_records)
+                    VALUES (date(NEW.created_at), NEW.status, 1, COALESCE(NEW.total_records, 0))
+                    ON CONFLICT(day, status) DO UPDATE SET
+                        count = count + 1,
+                        sum_records = sum_records + excluded.sum_records;
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_job_stats_delete AFTER DELETE ON jobs
+                BEGIN
+                    UPDATE job_stats_daily
+                    SET count = count - 1,
+                        sum_records = sum_records - COALESCE(OLD.total_records, 0)
+                    WHERE day = date(OLD.created_at) AND status IS OLD.status;
+                END;
+
+                -- One-time backfill for databases created before the roll-up existed
+                INSERT INTO job_stats_daily (day, status, count, sum_records)
+                SELECT date(created_at), status, COUNT(*), COALESCE(SUM(total_records), 0)
+                FROM jobs
+                WHERE NOT EXISTS (SELECT 1 FROM job_stats_daily)
+                GROUP BY date(created_at), status;
                 """
             )
-            await db.commit()
-            logger.info("database_initialized", db_path=self.db_path)
-
-    async def create_job(self, job_id: str, name: Optional[str] = None) -> Dict[str, Any]:
-        """Insert a job; if it already exists, reset it."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
-            # First check if job exists
-            cursor = await db.execute(
-                "SELECT * FROM jobs WHERE job_id = ?",
-                (job_id,),
-            )
-            existing = await cursor.fetchone()
-            
-            if existing:
-                # Job exists - reset it
-                logger.warning("job_already_exists_resetting", job_id=job_id)
-                await db.execute(
-                    """
-                    UPDATE jobs
-                    SET name = ?, status = ?, progress = 0, 
-                        error_message = NULL, updated_at = CURRENT_TIMESTAMP
-                    WHERE job_id = ?
-                    """,
-                    (name or job_id, "pending", job_id),
-                )
-            else:
-                # Job doesn't exist - create it
-                await db.execute(
-                    """
-                    INSERT INTO jobs (job_id, name, status, progress, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                    """,
-                    (job_id, name or job_id, "pending", 0),
-                )
-                logger.info("job_created", job_id=job_id, name=name)
 
-            await db.commit()
+        # executescript manages its own transaction, so it runs outside a batch
+        await self._submit(init_schema, transactional=False)
+        logger.info("database_initialized", db_path=self.db_path)
 
-            # Fetch and return the job
-            cursor = await db.execute(
-                "SELECT * FROM jobs WHERE job_id = ?",
-                (job_id,),
-            )
-            row = await cursor.fetchone()
-            return dict(row) if row else {}
+    async def create_job(
+        self, job_id: str, name: Optional[str] = None, status: str = "pending"
+    ) -> Dict[str, Any]:
+        """Insert a job with the given initial status; if it already exists, reset it."""
+        # Single upsert round-trip; RETURNING (SQLite 3.35+) hands back the row
+        rows = await self._execute(
+            f"""
+            INSERT INTO jobs (job_id, name, status, progress, created_at, updated_at)
+            VALUES (?, ?, ?, 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+            ON CONFLICT(job_id) DO UPDATE SET
+                name = excluded.name, status = excluded.status, progress = 0,
+                error_message = NULL, updated_at = CURRENT_TIMESTAMP
+            RETURNING {_JOB_SELECT}
+            """,
+            (job_id, name or job_id, status),
+        )
+        logger.info("job_created", job_id=job_id, name=name, status=status)
+        return _as_dicts(JOB_COLUMNS, rows)[0] if rows else {}
+
+    async def create_jobs(self, specs: List[Tuple[str, Optional[str], str]]) -> int:
+        """Insert (or reset) many jobs in one transaction.
+
+        Each spec is ``(job_id, name, status)``. Returns the number of jobs written.
+        """
+        if not specs:
+            return 0
+        await self._executemany(
+            """
+            INSERT INTO jobs (job_id, name, status, progress, created_at, updated_at)
+            VALUES (?, ?, ?, 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+            ON CONFLICT(job_id) DO UPDATE SET
+                name = excluded.name, status = excluded.status, progress = 0,
+                error_message = NULL, updated_at = CURRENT_TIMESTAMP
+            """,
+            [(job_id, name or job_id, status) for job_id, name, status in specs],
+        )
+        logger.info("jobs_created", count=len(specs))
+        return len(specs)
 
     async def update_job_status(
         self,
@@ -135,29 +464,27 @@ class StateManager:
         error_message: Optional[str] = None,
     ) -> None:
         """Update job status and progress"""
-        async with aiosqlite.connect(self.db_path) as db:
-            if error_message:
-                await db.execute(
-                    """
-                    UPDATE jobs
-                    SET status = ?, progress = COALESCE(?, progress), 
-                        error_message = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE job_id = ?
-                    """,
-                    (status, progress, error_message, job_id),
-                )
-            else:
-                await db.execute(
-                    """
-                    UPDATE jobs
-                    SET status = ?, progress = COALESCE(?, progress), 
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE job_id = ?
-                    """,
-                    (status, progress, job_id),
-                )
-            await db.commit()
-            logger.info("job_status_updated", job_id=job_id, status=status, progress=progress)
+        if error_message:
+            await self._execute(
+                """
+                UPDATE jobs
+                SET status = ?, progress = COALESCE(?, progress), 
+                    error_message = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE job_id = ?
+                """,
+                (status, progress, error_message, job_id),
+            )
+        else:
+            await self._execute(
+                """
+                UPDATE jobs
+                SET status = ?, progress = COALESCE(?, progress), 
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE job_id = ?
+                """,
+                (status, progress, job_id),
+            )
+        logger.info("job_status_updated", job_id=job_id, status=status, progress=progress)
 
     async def update_job_completion(
         self,
@@ -169,44 +496,40 @@ class StateManager:
         error_message: Optional[str] = None,
     ) -> None:
         """Update job completion details"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                UPDATE jobs
-                SET status = ?, total_records = ?, processed_records = ?,
-                    failed_records = ?, error_message = ?, 
-                    completed_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
-                WHERE job_id = ?
-                """,
-                (
-                    status,
-                    total_records,
-                    processed_records,
-                    failed_records,
-                    error_message,
-                    job_id,
-                ),
-            )
-            await db.commit()
-            logger.info(
-                "job_completed",
-                job_id=job_id,
-                status=status,
-                total=total_records,
-                processed=processed_records,
-                failed=failed_records,
-            )
+        await self.flush_logs()
+        await self._execute(
+            """
+            UPDATE jobs
+            SET status = ?, total_records = ?, processed_records = ?,
+                failed_records = ?, error_message = ?, 
+                completed_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+            WHERE job_id = ?
+            """,
+            (
+                status,
+                total_records,
+                processed_records,
+                failed_records,
+                error_message,
+                job_id,
+            ),
+        )
+        logger.info(
+            "job_completed",
+            job_id=job_id,
+            status=status,
+            total=total_records,
+            processed=processed_records,
+            failed=failed_records,
+        )
 
     async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get job details"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                "SELECT * FROM jobs WHERE job_id = ?",
-                (job_id,),
-            )
-            row = await cursor.fetchone()
-            return dict(row) if row else None
+        rows = await self._read(
+            f"SELECT {_JOB_SELECT} FROM jobs WHERE job_id = ?",
+            (job_id,),
+        )
+        return dict(zip(JOB_COLUMNS, rows[0], strict=True)) if rows else None
 
     async def list_jobs(
         self,
@@ -215,112 +538,241 @@ class StateManager:
         status: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """List all jobs with pagination"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
-            if status:
-                cursor = await db.execute(
-                    """
-                    SELECT * FROM jobs WHERE status = ?
-                    ORDER BY created_at DESC
-                    LIMIT ? OFFSET ?
-                    """,
-                    (status, limit, offset),
-                )
-            else:
-                cursor = await db.execute(
-                    """
-                    SELECT * FROM jobs
-                    ORDER BY created_at DESC
-                    LIMIT ? OFFSET ?
-                    """,
-                    (limit, offset),
-                )
-            
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        if status:
+            rows = await self._read(
+                f"""
+                SELECT {_JOB_SELECT} FROM jobs WHERE status = ?
+                ORDER BY created_at DESC, id DESC
+                LIMIT ? OFFSET ?
+                """,
+                (status, limit, offset),
+            )
+        else:
+            rows = await self._read(
+                f"""
+                SELECT {_JOB_SELECT} FROM jobs
+                ORDER BY created_at DESC, id DESC
+                LIMIT ? OFFSET ?
+                """,
+                (limit, offset),
+            )
+        return _as_dicts(JOB_COLUMNS, rows)
+
+    async def list_jobs_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """List jobs newest-first using keyset pagination.
+
+        ``cursor`` is the ``next_cursor`` returned by the previous page; each page
+        costs the same regardless of depth, unlike OFFSET. Returns
+        ``(jobs, next_cursor)``, with ``next_cursor`` None on the last page.
+        """
+        conditions: List[str] = []
+        params: List[Any] = []
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if cursor:
+            created_at, _, last_id = cursor.rpartition("|")
+            if not created_at or not last_id.isdigit():
+                raise ValueError(f"Invalid job list cursor: {cursor!r}")
+            conditions.append("(created_at, id) < (?, ?)")
+            params.extend([created_at, int(last_id)])
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = _as_dicts(
+            JOB_COLUMNS,
+            await self._read(
+                f"""
+                SELECT {_JOB_SELECT} FROM jobs {where}
+                ORDER BY created_at DESC, id DESC
+                LIMIT ?
+                """,
+                (*params, limit),
+            ),
+        )
+
+        next_cursor = self.job_cursor(rows[-1]) if len(rows) == limit else None
+        return rows, next_cursor
+
+    @staticmethod
+    def job_cursor(job: Dict[str, Any]) -> str:
+        """Build the list_jobs_page cursor that continues after ``job``"""
+        return f"{job['created_at']}|{job['id']}"
 
     async def get_job_count(self, status: Optional[str] = None) -> int:
         """Get total job count"""
-        async with aiosqlite.connect(self.db_path) as db:
-            if status:
-                cursor = await db.execute(
-                    "SELECT COUNT(*) FROM jobs WHERE status = ?",
-                    (status,),
-                )
-            else:
-                cursor = await db.execute("SELECT COUNT(*) FROM jobs")
-            
-            result = await cursor.fetchone()
-            return result[0] if result else 0
+        if status:
+            rows = await self._read(
+                "SELECT COUNT(*) FROM jobs WHERE status = ?",
+                (status,),
+            )
+        else:
+            rows = await self._read("SELECT COUNT(*) FROM jobs")
+        return rows[0][0] if rows else 0
 
     async def add_job_log(self, job_id: str, level: str, message: str) -> None:
-        """Add a log entry for a job"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                INSERT INTO job_logs (job_id, level, message)
-                VALUES (?, ?, ?)
-                """,
-                (job_id, level, message),
-            )
-            await db.commit()
+        """Add a log entry for a job.
+
+        Entries are buffered and written in batches; use ``flush_logs()`` to
+        write them immediately.
+        """
+        self._log_buf.append((job_id, level, message))
+        if len(self._log_buf) >= LOG_FLUSH_SIZE:
+            await self.flush_logs()
+        elif self._log_flush_task is None:
+            self._log_flush_task = asyncio.create_task(self._flush_logs_later())
+
+    async def add_job_logs_batch(self, job_id: str, entries: List[Tuple[str, str]]) -> int:
+        """Write many ``(level, message)`` log entries for a job in one transaction.
+
+        Returns the number of entries written.
+        """
+        if not entries:
+            return 0
+        # Keep entries in call order relative to anything still buffered
+        await self.flush_logs()
+        await self._executemany(
+            "INSERT INTO job_logs (job_id, level, message) VALUES (?, ?, ?)",
+            [(job_id, level, message) for level, message in entries],
+        )
+        return len(entries)
+
+    async def flush_logs(self) -> None:
+        """Write all buffered log entries (a no-op when nothing is buffered)"""
+        if not self._log_buf:
+            return
+        entries, self._log_buf = self._log_buf, []
+        await self._executemany(
+            "INSERT INTO job_logs (job_id, level, message) VALUES (?, ?, ?)",
+            entries,
+        )
+
+    async def _flush_logs_later(self) -> None:
+        """Flush the log buffer after LOG_FLUSH_INTERVAL"""
+        await asyncio.sleep(LOG_FLUSH_INTERVAL)
+        self._log_flush_task = None
+        try:
+            await self.flush_logs()
+        except Exception:
+            logger.exception("job_log_flush_failed")
 
     async def get_job_logs(self, job_id: str) -> List[Dict[str, Any]]:
         """Get all logs for a job"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                """
-                SELECT * FROM job_logs
-                WHERE job_id = ?
-                ORDER BY created_at ASC
-                """,
-                (job_id,),
-            )
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        await self.flush_logs()
+        rows = await self._read(
+            f"""
+            SELECT {_JOB_LOG_SELECT} FROM job_logs
+            WHERE job_id = ?
+            ORDER BY created_at ASC, id ASC
+            """,
+            (job_id,),
+        )
+        return _as_dicts(JOB_LOG_COLUMNS, rows)
 
     async def delete_job(self, job_id: str) -> None:
         """Delete a job and its steps from the state DB (irreversible)."""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("DELETE FROM job_logs WHERE job_id = ?", (job_id,))
-            await db.execute("DELETE FROM job_steps WHERE job_id = ?", (job_id,))
-            await db.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
-            await db.commit()
-            logger.info("job_deleted", job_id=job_id)
+
+        def delete(conn: sqlite3.Connection) -> None:
+            conn.execute("DELETE FROM job_logs WHERE job_id = ?", (job_id,))
+            conn.execute("DELETE FROM job_steps WHERE job_id = ?", (job_id,))
+            conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+
+        await self._submit(delete)
+        logger.info("job_deleted", job_id=job_id)
 
     async def cleanup_pending_jobs(self, older_than_seconds: Optional[int] = None) -> int:
         """Mark pending jobs as failed (optionally only those older than given seconds).
         
         Returns number of jobs marked failed.
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            # Build selection
-            if older_than_seconds is None:
-                cursor = await db.execute("SELECT job_id FROM jobs WHERE status = 'pending'")
-            else:
-                # Convert to datetime comparison using SQLite datetime functions
-                cursor = await db.execute(
-                    "SELECT job_id FROM jobs WHERE status = 'pending' AND created_at <= datetime('now', ?)",
-                    (f'-{older_than_seconds} seconds',),
-                )
-            rows = await cursor.fetchall()
-            job_ids = [r[0] for r in rows]
-            
-            for jid in job_ids:
-                await db.execute(
-                    "UPDATE jobs SET status = ?, error_message = ?, updated_at = CURRENT_TIMESTAMP WHERE job_id = ?",
-                    ("failed", "Marked failed by cleanup", jid),
-                )
-            await db.commit()
-            logger.info("cleanup_pending_jobs", count=len(job_ids))
-            return len(job_ids)
-
-    async def save_job_result(self, job_id: str, result: PipelineResult) -> None:
-        """Save complete job result"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
+        # One UPDATE ... RETURNING (SQLite 3.35+) instead of SELECT + per-row UPDATEs
+        if older_than_seconds is None:
+            rows = await self._execute(
+                """
+                UPDATE jobs SET status = 'failed', error_message = ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE status = 'pending'
+                RETURNING job_id
+                """,
+                ("Marked failed by cleanup",),
+            )
+        else:
+            # Compare using SQLite datetime functions
+            rows = await self._execute(
+                """
+                UPDATE jobs SET status = 'failed', error_message = ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE status = 'pending' AND created_at <= datetime('now', ?)
+                RETURNING job_id
+                """,
+                ("Marked failed by cleanup", f'-{older_than_seconds} seconds'),
+            )
+        logger.info("cleanup_pending_jobs", count=len(rows))
+        return len(rows)
+
+    @staticmethod
+    def _step_row(job_id: str, step_name: str, step_result: StepResult) -> tuple:
+        """Build the job_steps INSERT parameters for a step result"""
+        # getattr with a default is one lookup; hasattr + attribute access is two
+        status = step_result.status
+        return (
+            job_id,
+            step_name,
+            str(getattr(status, "value", status)),
+            getattr(step_result, "start_time", None),
+            getattr(step_result, "end_time", None),
+            getattr(step_result, "duration_seconds", None),
+            getattr(step_result, "records_processed", 0),
+            getattr(step_result, "records_failed", 0),
+            getattr(step_result, "error_message", None),
+        )
+
+    async def save_job_step(self, job_id: str, step_name: str, step_result: StepResult) -> None:
+        """Persist a single step result as soon as the step completes"""
+        await self._execute(
+            """
+            INSERT INTO job_steps
+            (job_id, step_name, status, start_time, end_time,
+             duration_seconds, records_processed, records_failed, error_message)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            self._step_row(job_id, step_name, step_result),
+        )
+        logger.debug("job_step_saved", job_id=job_id, step=step_name)
+
+    async def save_job_result(
+        self, job_id: str, result: PipelineResult, include_steps: bool = True
+    ) -> None:
+        """Save complete job result.
+
+        Pass ``include_steps=False`` when steps were already streamed with
+        ``save_job_step`` so only the job summary is updated.
+        """
+        status = result.status
+        errors = getattr(result, "errors", None) or ()
+        summary = (
+            str(getattr(status, "value", status)),
+            result.end_time,
+            result.total_records_processed,
+            result.total_records_processed - len(errors),
+            len(errors),
+            "; ".join(errors) or None,
+            job_id,
+        )
+        step_results = getattr(result, "step_results", None) if include_steps else None
+        steps = [
+            self._step_row(job_id, step_name, step_result)
+            for step_name, step_result in (step_results or {}).items()
+        ]
+
+        def save(conn: sqlite3.Connection) -> None:
+            # Runs as one operation on the worker, so the UPDATE and step inserts
+            # commit (or roll back) together
+            conn.execute(
                 """
                 UPDATE jobs SET
                     status = ?,
@@ -332,82 +784,57 @@ class StateManager:
                     updated_at = CURRENT_TIMESTAMP
                 WHERE job_id = ?
                 """,
-                (
-                    result.status.value if hasattr(result.status, 'value') else str(result.status),
-                    result.end_time.isoformat() if result.end_time else None,
-                    result.total_records_processed,
-                    result.total_records_processed - len(result.errors) if hasattr(result, 'errors') else 0,
-                    len(result.errors) if hasattr(result, 'errors') else 0,
-                    "; ".join(result.errors) if hasattr(result, 'errors') and result.errors else None,
-                    job_id,
-                ),
+                summary,
             )
+            if steps:
+                conn.executemany(
+                    """
+                    INSERT INTO job_steps
+                    (job_id, step_name, status, start_time, end_time,
+                     duration_seconds, records_processed, records_failed, error_message)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    steps,
+                )
 
-            # Save step results if available
-            if hasattr(result, 'step_results'):
-                for step_name, step_result in result.step_results.items():
-                    await db.execute(
-                        """
-                        INSERT INTO job_steps
-                        (job_id, step_name, status, start_time, end_time,
-                         duration_seconds, records_processed, records_failed, error_message)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            job_id,
-                            step_name,
-                            step_result.status.value if hasattr(step_result.status, 'value') else str(step_result.status),
-                            step_result.start_time.isoformat() if hasattr(step_result, 'start_time') and step_result.start_time else None,
-                            step_result.end_time.isoformat() if hasattr(step_result, 'end_time') and step_result.end_time else None,
-                            step_result.duration_seconds if hasattr(step_result, 'duration_seconds') else None,
-                            step_result.records_processed if hasattr(step_result, 'records_processed') else 0,
-                            step_result.records_failed if hasattr(step_result, 'records_failed') else 0,
-                            step_result.error_message if hasattr(step_result, 'error_message') else None,
-                        ),
-                    )
-
-            await db.commit()
-            logger.info("job_result_saved", job_id=job_id)
+        await self._submit(save)
+        logger.info("job_result_saved", job_id=job_id)
 
     async def get_job_steps(self, job_id: str) -> List[Dict[str, Any]]:
         """Get job steps"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                "SELECT * FROM job_steps WHERE job_id = ? ORDER BY id",
-                (job_id,),
-            )
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        rows = await self._read(
+            f"SELECT {_JOB_STEP_SELECT} FROM job_steps WHERE job_id = ? ORDER BY id",
+            (job_id,),
+        )
+        return _as_dicts(JOB_STEP_COLUMNS, rows)
 
     async def get_recent_job_stats(self, days: int = 7) -> Dict[str, Any]:
-        """Get job statistics for recent period"""
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                """
-                SELECT
-                    status,
-                    COUNT(*) as count,
-                    SUM(total_records) as total_records
-                FROM jobs
-                WHERE created_at >= datetime('now', ?)
-                GROUP BY status
-                """,
-                (f"-{days} days",),
-            )
-            rows = await cursor.fetchall()
-
-            stats = {
-                "total": 0,
-                "by_status": {},
-                "total_records": 0,
-            }
-
-            for row in rows:
-                status, count, records = row
-                stats["by_status"][status] = count
-                stats["total"] += count
-                if records:
-                    stats["total_records"] += records
-
-            return stats
\ No newline at end of file
+        """Get job statistics for recent period (whole days, from the daily roll-up)"""
+        rows = await self._read(
+            """
+            SELECT
+                status,
+                SUM(count) as count,
+                SUM(sum_records) as total_records
+            FROM job_stats_daily
+            WHERE day >= date('now', ?)
+            GROUP BY status
+            HAVING SUM(count) > 0
+            """,
+            (f"-{days} days",),
+        )
+
+        stats = {
+            "total": 0,
+            "by_status": {},
+            "total_records": 0,
+        }
+
+        for row in rows:
+            status, count, records = row
+            stats["by_status"][status] = count
+            stats["total"] += count
+            if records:
+                stats["total_records"] += records
+
+        return stats
@@ -1,6 +1,6 @@
 """Transform module for ETL Pipeline"""
 
 from src.transform.base_transformer import BaseTransformer
-from src.transform.validators import DataValidator, ValidationResult
+from src.transform.validators import DataValidator, FieldValidator, ValidationResult
 
-__all__ = ["BaseTransformer", "DataValidator", "ValidationResult"]
+__all__ = ["BaseTransformer", "DataValidator", "FieldValidator", "ValidationResult"]
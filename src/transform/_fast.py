@@ -0,0 +1,97 @@
+"""Compiled kernels for bulk column conversion.
+
+numba is optional: when it is installed the kernels are JIT-compiled,
+otherwise equivalent vectorized NumPy code is used.
+"""
+
+import math
+from typing import Callable, Tuple
+
+import numpy as np
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import numba
+except ImportError:  # numba is an optional accelerator
+    numba = None
+
+# Floats at or beyond this magnitude do not fit an int64 once truncated
+INT64_LIMIT = 2.0 ** 63
+
+# Integers up to this magnitude convert to float64 exactly
+FLOAT64_EXACT_LIMIT = 2 ** 53
+
+_fallback_logged = False
+
+
+def optional_njit(fn: Callable) -> Callable:
+    """Compile ``fn`` with ``numba.njit`` when numba is available"""
+    if numba is None:
+        return fn
+    return numba.njit(cache=True)(fn)
+
+
+@optional_njit
+def _truncate_to_int64(values, out, valid):  # pragma: no cover - only runs compiled
+    """Truncate finite floats toward zero into ``out``; return True on overflow"""
+    for i in range(values.shape[0]):
+        value = values[i]
+        if math.isfinite(value):
+            if value >= INT64_LIMIT or value <= -INT64_LIMIT:
+                return True
+            out[i] = int(value)
+            valid[i] = True
+    return False
+
+
+@optional_njit
+def _outside_range(values, lo, hi, out):  # pragma: no cover - only runs compiled
+    """Set ``out[i]`` when ``values[i]`` is below ``lo`` or above ``hi``"""
+    for i in range(values.shape[0]):
+        value = values[i]
+        out[i] = value < lo or value > hi
+
+
+def _log_fallback() -> None:
+    """Note once per process that the NumPy fallback is in use"""
+    global _fallback_logged
+    if not _fallback_logged:
+        _fallback_logged = True
+        logger.info("numba_unavailable", fallback="numpy")
+
+
+def to_int_array(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Truncate float64 values toward zero into int64, like ``int(float(value))``.
+
+    Returns ``(ints, valid)`` where ``valid`` is False for NaN and infinite
+    entries. Raises OverflowError if a value does not fit an int64.
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if numba is not None:
+        ints = np.zeros(values.shape[0], dtype=np.int64)
+        valid = np.zeros(values.shape[0], dtype=np.bool_)
+        if _truncate_to_int64(values, ints, valid):
+            raise OverflowError("value out of int64 range")
+        return ints, valid
+
+    _log_fallback()
+    valid = np.isfinite(values)
+    finite = np.where(valid, values, 0.0)
+    if np.any(np.abs(finite) >= INT64_LIMIT):
+        raise OverflowError("value out of int64 range")
+    return np.trunc(finite).astype(np.int64), valid
+
+
+def range_mask(values: np.ndarray, lo: float = -math.inf, hi: float = math.inf) -> np.ndarray:
+    """Return a bool mask of float64 values below ``lo`` or above ``hi`` (never NaN)"""
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if numba is not None:
+        out = np.empty(values.shape[0], dtype=np.bool_)
+        _outside_range(values, float(lo), float(hi), out)
+        return out
+
+    _log_fallback()
+    return (values < lo) | (values > hi)
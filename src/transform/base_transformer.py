@@ -1,28 +1,136 @@
 """Base transformer class for data transformation"""
 
+import asyncio
 from abc import abstractmethod
-from typing import Any, Dict, List, Optional, Type
+from functools import partial
+from itertools import repeat
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
-from src.core.interfaces import Transformer, PipelineContext
+import numpy as np
+import pandas as pd
+
+from src.core.interfaces import PipelineContext, Transformer
+from src.transform._fast import FLOAT64_EXACT_LIMIT, to_int_array
 from src.transform.validators import DataValidator, ValidationResult
+from src.utils.helpers import chunk_list, ichunk, parse_datetime, safe_bool, safe_float, safe_int
 from src.utils.logging import get_logger
-from src.utils.helpers import parse_datetime, safe_float, safe_int, safe_bool
 
 logger = get_logger(__name__)
 
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is optional (the "arrow" extra)
+    pa = None
+
+# (field, kind, max_length); kind is "int", "float", "str", "datetime" or "bool"
+ColumnSpec = Tuple[str, str, Optional[int]]
+
+
+# Arrow type factory per column kind, for transform_table
+ARROW_TYPES: Dict[str, Callable[[], Any]] = (
+    {
+        "int": pa.int64,
+        "float": pa.float64,
+        "str": pa.string,
+        "datetime": lambda: pa.timestamp("us"),
+        "bool": pa.bool_,
+    }
+    if pa is not None
+    else {}
+)
+
+
+def _column_values(series: pd.Series, missing: np.ndarray) -> List[Any]:
+    """Return a column as a list of Python scalars, with ``missing`` entries as None"""
+    return series.astype(object).where(~missing, None).tolist()
+
 
 class BaseTransformer(Transformer):
     """Base class for data transformers with validation and type conversion"""
 
+    # Output columns. Transformers that declare them get a generic
+    # transform_record and convert whole batches column-by-column in transform().
+    COLUMN_TYPES: ClassVar[Tuple[ColumnSpec, ...]] = ()
+
+    # Built once per class from COLUMN_TYPES: output field names,
+    # (field, converter) pairs and, with pyarrow installed, the Arrow schema
+    _FIELDS: ClassVar[Tuple[str, ...]] = ()
+    _PLAN: ClassVar[Tuple[Tuple[str, Callable[[Any], Any]], ...]] = ()
+    ARROW_SCHEMA: ClassVar[Optional["pa.Schema"]] = None
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls._FIELDS = tuple(field for field, _, _ in cls.COLUMN_TYPES)
+        cls._PLAN = tuple(
+            (field, cls.converter(kind, max_length))
+            for field, kind, max_length in cls.COLUMN_TYPES
+        )
+        if pa is not None and cls.COLUMN_TYPES:
+            cls.ARROW_SCHEMA = pa.schema(
+                [(field, ARROW_TYPES[kind]()) for field, kind, _ in cls.COLUMN_TYPES]
+            )
+        # Unless the subclass hand-writes transform_record, swap in a version
+        # specialized to its columns
+        if cls._PLAN and getattr(cls.transform_record, "_from_column_types", False):
+            cls.transform_record = cls._compile_transform_record()
+
+    @classmethod
+    def _compile_transform_record(cls) -> Callable[..., Optional[Dict[str, Any]]]:
+        """Generate transform_record with every field fetch and conversion inlined.
+
+        The result behaves exactly like the generic implementation but runs as
+        a single dict display: no loop, no tuple unpacking, no ``self`` lookups.
+        """
+        namespace: Dict[str, Any] = {}
+        entries = []
+        for i, (field, convert) in enumerate(cls._PLAN):
+            namespace[f"_c{i}"] = convert
+            entries.append(f"        {field!r}: _c{i}(g({field!r})),")
+        source = "\n".join(
+            [
+                "def transform_record(self, record, context):",
+                "    g = record.get",
+                "    return {",
+                *entries,
+                "    }",
+            ]
+        )
+        exec(compile(source, f"<{cls.__name__}.transform_record>", "exec"), namespace)
+        fn = namespace["transform_record"]
+        fn.__qualname__ = f"{cls.__name__}.transform_record"
+        fn.__doc__ = BaseTransformer.transform_record.__doc__
+        fn._from_column_types = True
+        return fn
+
     def __init__(
         self,
         source_key: str,
         validator: Optional[DataValidator] = None,
         skip_invalid: bool = True,
+        parallelism: int = 1,
+        chunk_size: int = 2048,
     ):
         self._source_key = source_key
         self.validator = validator
         self.skip_invalid = skip_invalid
+        # With parallelism > 1, batches larger than chunk_size are split and
+        # converted in worker threads (pandas releases the GIL in its C loops)
+        self.parallelism = parallelism
+        self.chunk_size = chunk_size
 
     @property
     def source_key(self) -> str:
@@ -34,12 +142,30 @@ class BaseTransformer(Transformer):
         """Return the name of this transformer"""
         pass
 
-    @abstractmethod
     def transform_record(
         self, record: Dict[str, Any], context: PipelineContext
     ) -> Optional[Dict[str, Any]]:
-        """Transform a single record. Return None to skip the record."""
-        pass
+        """Transform a single record. Return None to skip the record.
+
+        The default converts every ``COLUMN_TYPES`` field; transformers without
+        column types must override this.
+        """
+        if not self._PLAN:
+            raise NotImplementedError(
+                f"{type(self).__name__} must define COLUMN_TYPES or override transform_record"
+            )
+        get = record.get
+        return {field: convert(get(field)) for field, convert in self._PLAN}
+
+    # Marks transform_record implementations derived purely from COLUMN_TYPES
+    transform_record._from_column_types = True  # type: ignore[attr-defined]
+
+    @property
+    def columnar(self) -> bool:
+        """Whether batches can be converted column-by-column"""
+        return bool(self.COLUMN_TYPES) and getattr(
+            type(self).transform_record, "_from_column_types", False
+        )
 
     async def transform(
         self, data: List[Dict[str, Any]], context: PipelineContext
@@ -51,54 +177,307 @@ class BaseTransformer(Transformer):
             input_count=len(data),
         )
 
-        transformed: List[Dict[str, Any]] = []
+        transformed, validation_errors, transform_errors = await self._transform_batch(
+            data, context
+        )
+
+        logger.info(
+            "transform_completed",
+            transformer=self.name,
+            input_count=len(data),
+            output_count=len(transformed),
+            validation_errors=validation_errors,
+            transform_errors=transform_errors,
+        )
+
+        return transformed
+
+    async def transform_stream(
+        self,
+        records: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+        context: PipelineContext,
+        batch_size: int = 1024,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Transform records incrementally, yielding micro-batches.
+
+        ``records`` may be a plain or async iterable. Up to ``batch_size``
+        input records are held at a time, so a consumer (e.g. a loader) can
+        start on the first batch while later ones are still being produced.
+        """
+        logger.info("transform_stream_started", transformer=self.name, batch_size=batch_size)
+        input_count = output_count = validation_errors = transform_errors = 0
+
+        async def batches() -> AsyncIterator[List[Dict[str, Any]]]:
+            if not isinstance(records, AsyncIterable):
+                for chunk in ichunk(records, batch_size):
+                    yield chunk
+                return
+            buffer: List[Dict[str, Any]] = []
+            async for record in records:
+                buffer.append(record)
+                if len(buffer) >= batch_size:
+                    yield buffer
+                    buffer = []
+            if buffer:
+                yield buffer
+
+        async for batch in batches():
+            transformed, invalid, failed = await self._transform_batch(
+                batch, context, offset=input_count
+            )
+            input_count += len(batch)
+            output_count += len(transformed)
+            validation_errors += invalid
+            transform_errors += failed
+            if transformed:
+                yield transformed
+
+        logger.info(
+            "transform_stream_completed",
+            transformer=self.name,
+            input_count=input_count,
+            output_count=output_count,
+            validation_errors=validation_errors,
+            transform_errors=transform_errors,
+        )
+
+    async def _transform_batch(
+        self, data: List[Dict[str, Any]], context: PipelineContext, offset: int = 0
+    ) -> Tuple[List[Dict[str, Any]], int, int]:
+        """Validate and transform a batch.
+
+        Returns ``(transformed, validation_errors, transform_errors)``;
+        ``offset`` is the position of ``data[0]`` in the overall input.
+        """
+        records = data
         validation_errors = 0
         transform_errors = 0
 
-        for i, record in enumerate(data):
+        # Validate if validator is configured
+        if self.validator:
+            # One screened pass over the batch; if a check raises, redo it
+            # record by record so the failing record is isolated below
+            try:
+                batch_results = self.validator.validate_batch(data)
+            except Exception:
+                batch_results = None
+            records = []
+            for i, record in enumerate(data, offset):
+                try:
+                    if batch_results is not None:
+                        result = batch_results[i - offset]
+                    else:
+                        result = self.validator.validate(record)
+                except Exception as e:
+                    transform_errors += 1
+                    logger.error(
+                        "record_transform_error",
+                        index=i,
+                        error=str(e),
+                    )
+                    if not self.skip_invalid:
+                        raise
+                    continue
+                if not result.is_valid:
+                    validation_errors += 1
+                    if self.skip_invalid:
+                        logger.debug(
+                            "record_validation_failed",
+                            index=i,
+                            errors=result.errors,
+                        )
+                        continue
+                    else:
+                        context.add_warning(
+                            f"Record {i} validation failed: {result.errors}"
+                        )
+                records.append(record)
+
+        if self.parallelism > 1 and len(records) > self.chunk_size:
+            semaphore = asyncio.Semaphore(self.parallelism)
+
+            async def run_chunk(chunk: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+                async with semaphore:
+                    return await asyncio.to_thread(self._transform_chunk, chunk, context)
+
+            # gather keeps chunk order, so output order matches input order
+            results = await asyncio.gather(
+                *(run_chunk(chunk) for chunk in chunk_list(records, self.chunk_size))
+            )
+        else:
+            results = [self._transform_chunk(records, context)]
+
+        transformed = [row for rows, _ in results for row in rows]
+        transform_errors += sum(errors for _, errors in results)
+        return transformed, validation_errors, transform_errors
+
+    def _transform_chunk(
+        self, records: List[Dict[str, Any]], context: PipelineContext
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Transform validated records; returns ``(transformed, transform_errors)``"""
+        if self.columnar:
             try:
-                # Validate if validator is configured
-                if self.validator:
-                    result = self.validator.validate(record)
-                    if not result.is_valid:
-                        validation_errors += 1
-                        if self.skip_invalid:
-                            logger.debug(
-                                "record_validation_failed",
-                                index=i,
-                                errors=result.errors,
-                            )
-                            continue
-                        else:
-                            context.add_warning(
-                                f"Record {i} validation failed: {result.errors}"
-                            )
-
-                # Transform the record
-                transformed_record = self.transform_record(record, context)
-                if transformed_record is not None:
-                    transformed.append(transformed_record)
+                return self.transform_columns(records), 0
+            except Exception as e:
+                # Fall back to the row-by-row loop, which isolates bad records
+                logger.warning("columnar_transform_failed", transformer=self.name, error=str(e))
 
+        # list.extend drives map() in C; when a record raises, map has already
+        # consumed it, so extending again from the same iterator resumes after it
+        rows: List[Optional[Dict[str, Any]]] = []
+        transform_errors = 0
+        remaining = iter(records)
+        while True:
+            try:
+                rows.extend(map(self.transform_record, remaining, repeat(context)))
+                break
             except Exception as e:
-                transform_errors += 1
                 logger.error(
                     "record_transform_error",
-                    index=i,
+                    index=len(rows) + transform_errors,
                     error=str(e),
                 )
+                transform_errors += 1
                 if not self.skip_invalid:
                     raise
+        return [row for row in rows if row is not None], transform_errors
 
-        logger.info(
-            "transform_completed",
-            transformer=self.name,
-            input_count=len(data),
-            output_count=len(transformed),
-            validation_errors=validation_errors,
-            transform_errors=transform_errors,
-        )
+    def transform_columns(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Convert a batch column-by-column with pandas.
 
-        return transformed
+        Produces the same values as ``transform_record`` on each record, but
+        numeric and string conversions run once per column instead of per cell.
+        """
+        fields = self._FIELDS
+        return [dict(zip(fields, row, strict=True)) for row in self.transform_rows(records)]
+
+    def transform_rows(self, records: List[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
+        """Convert a batch to one tuple per record, in ``COLUMN_TYPES`` order.
+
+        Same values as ``transform_columns`` without a dict per row; the
+        tuples have the parameter shape DB-API ``executemany`` takes.
+        """
+        if not records:
+            return []
+        return list(zip(*self._convert_columns(records), strict=True))
+
+    def transform_table(self, records: List[Dict[str, Any]]) -> "pa.Table":
+        """Convert a batch to a columnar Arrow table (requires pyarrow).
+
+        Each field becomes one typed, contiguous Arrow array instead of a
+        value in every row dict. ``table.to_pylist()`` gives the same rows as
+        ``transform_columns``.
+        """
+        return pa.Table.from_arrays(self._arrow_arrays(records), schema=self.ARROW_SCHEMA)
+
+    def transform_batches(
+        self, records: List[Dict[str, Any]], batch_size: int = 10_000
+    ) -> Iterator["pa.RecordBatch"]:
+        """Convert records to Arrow record batches of ``batch_size`` rows (requires pyarrow).
+
+        Sized for the consumer, so a writer can take each batch as-is
+        instead of concatenating or slicing a table.
+        """
+        for chunk in ichunk(records, batch_size):
+            yield pa.RecordBatch.from_arrays(self._arrow_arrays(chunk), schema=self.ARROW_SCHEMA)
+
+    def _arrow_arrays(self, records: List[Dict[str, Any]]) -> List["pa.Array"]:
+        """Convert records to one typed Arrow array per COLUMN_TYPES field"""
+        if pa is None:
+            raise ImportError("Arrow output requires pyarrow (install the 'arrow' extra)")
+        if self.ARROW_SCHEMA is None:
+            raise NotImplementedError(f"{type(self).__name__} does not define COLUMN_TYPES")
+        columns = self._convert_columns(records) if records else [[] for _ in self._FIELDS]
+        return [
+            pa.array(values, type=field.type)
+            for values, field in zip(columns, self.ARROW_SCHEMA, strict=True)
+        ]
+
+    def _convert_columns(self, records: List[Dict[str, Any]]) -> List[List[Any]]:
+        """Convert raw records into one list of values per COLUMN_TYPES field"""
+        # record.get per field, as transform_record does: a DataFrame built
+        # from the dicts would fill absent keys with NaN, which is a value here
+        return [
+            self.convert_column(
+                pd.Series([record.get(field) for record in records], dtype=object),
+                kind,
+                max_length,
+            )
+            for field, kind, max_length in self.COLUMN_TYPES
+        ]
+
+    @staticmethod
+    def _to_float64(series: pd.Series) -> np.ndarray:
+        """Parse a column to float64 in one pass, unparseable values as NaN"""
+        return pd.to_numeric(series, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+
+    @classmethod
+    def convert_column(
+        cls, series: pd.Series, kind: str, max_length: Optional[int] = None
+    ) -> List[Any]:
+        """Convert a column of raw values to a list of ``kind`` values.
+
+        Gives the same values as the single-value ``converter(kind)``: only
+        None is missing, so NaN stays NaN for floats and becomes "nan" for
+        strings, as it does row by row.
+        """
+        values = series.to_numpy(dtype=object)
+        missing = np.equal(values, None)
+        if kind == "int":
+            numbers = cls._to_float64(series)
+            # NaN, infinities, unparseable values and magnitudes where float64
+            # is inexact are converted one by one
+            slow = ~(np.abs(numbers) < FLOAT64_EXACT_LIMIT) & ~missing
+            ints, valid = to_int_array(np.where(slow, np.nan, numbers))
+            result = _column_values(pd.Series(pd.arrays.IntegerArray(ints, ~valid)), ~valid)
+            for i in np.flatnonzero(slow).tolist():
+                result[i] = cls.to_int(values[i])
+            return result
+        if kind == "float":
+            numbers = cls._to_float64(series)
+            result = np.where(missing, None, numbers).tolist()
+            slow = ~(np.abs(numbers) < FLOAT64_EXACT_LIMIT) & ~missing
+            for i in np.flatnonzero(slow).tolist():
+                result[i] = cls.to_float(values[i])
+            return result
+        if kind == "str":
+            strings = series.astype(str).str.strip()
+            # One vectorized length check; most columns never need slicing
+            if max_length and strings.str.len().max() > max_length:
+                strings = strings.str.slice(0, max_length)
+            result = _column_values(strings, missing)
+            # astype(str) leaves NaN missing, where str() gives "nan"
+            for i in np.flatnonzero(strings.isna().to_numpy() & ~missing).tolist():
+                result[i] = cls.to_string(values[i], max_length=max_length)
+            return result
+        if kind == "datetime":
+            # Parse each distinct value once and fan the results back out
+            raw = values.tolist()
+            parsed = {value: parse_datetime(value) for value in set(raw)}
+            return [parsed[value] for value in raw]
+        if kind == "bool":
+            # JSON booleans (with gaps) cast in one step; anything else, such
+            # as "yes"/"0" strings or NaN, goes through safe_bool per value
+            present = series[~missing]
+            if pd.api.types.infer_dtype(present, skipna=False) in ("boolean", "empty"):
+                return series.where(~missing, False).to_numpy(dtype=bool).tolist()
+            return [safe_bool(value) for value in values.tolist()]
+        raise ValueError(f"Unknown column kind: {kind!r}")
+
+    @classmethod
+    def converter(cls, kind: str, max_length: Optional[int] = None) -> Callable[[Any], Any]:
+        """Return the single-value converter for ``kind``"""
+        if kind == "int":
+            return cls.to_int
+        if kind == "float":
+            return cls.to_float
+        if kind == "str":
+            return partial(cls.to_string, max_length=max_length) if max_length else cls.to_string
+        if kind == "datetime":
+            return cls.to_datetime
+        if kind == "bool":
+            return cls.to_bool
+        raise ValueError(f"Unknown column kind: {kind!r}")
 
     # Helper methods for type conversion
     @staticmethod
@@ -109,11 +488,19 @@ class BaseTransformer(Transformer):
     @staticmethod
     def to_float(value: Any, default: Optional[float] = None) -> Optional[float]:
         """Convert value to float"""
+        # JSON numbers arrive as float/int; `type() is` skips the try/except path
+        value_type = type(value)
+        if value_type is float:
+            return value
+        if value_type is int:
+            return float(value)
         return safe_float(value, default)
 
     @staticmethod
     def to_int(value: Any, default: Optional[int] = None) -> Optional[int]:
         """Convert value to integer"""
+        if type(value) is int:
+            return value
         return safe_int(value, default)
 
     @staticmethod
@@ -126,9 +513,12 @@ class BaseTransformer(Transformer):
         value: Any, default: Optional[str] = None, max_length: Optional[int] = None
     ) -> Optional[str]:
         """Convert value to string"""
-        if value is None:
+        if type(value) is str:
+            result = value.strip()
+        elif value is None:
             return default
-        result = str(value).strip()
+        else:
+            result = str(value).strip()
         if max_length and len(result) > max_length:
             result = result[:max_length]
         return result
@@ -1,33 +1,28 @@
 """Awards transformer"""
 
-from typing import Any, Dict, Optional
+from typing import Any
 
-from src.core.interfaces import PipelineContext
 from src.transform.base_transformer import BaseTransformer
 
 
 class AwardsTransformer(BaseTransformer):
     """Transform awards data for database storage"""
 
-    def __init__(self, source_key: str = "awards_extractor"):
-        super().__init__(source_key=source_key)
+    COLUMN_TYPES = (
+        ("award_id", "int", None),
+        ("award_fixed_id", "int", None),
+        ("code", "str", 50),
+        ("name", "str", 500),
+        ("award_operative_from", "datetime", None),
+        ("award_operative_to", "datetime", None),
+        ("version_number", "int", None),
+        ("last_modified_datetime", "datetime", None),
+        ("published_year", "int", None),
+    )
+
+    def __init__(self, source_key: str = "awards_extractor", **kwargs: Any):
+        super().__init__(source_key=source_key, **kwargs)
 
     @property
     def name(self) -> str:
         return "awards_transformer"
-
-    def transform_record(
-        self, record: Dict[str, Any], context: PipelineContext
-    ) -> Optional[Dict[str, Any]]:
-        """Transform an award record"""
-        return {
-            "award_id": self.to_int(record.get("award_id")),
-            "award_fixed_id": self.to_int(record.get("award_fixed_id")),
-            "code": self.to_string(record.get("code"), max_length=50),
-            "name": self.to_string(record.get("name"), max_length=500),
-            "award_operative_from": self.to_datetime(record.get("award_operative_from")),
-            "award_operative_to": self.to_datetime(record.get("award_operative_to")),
-            "version_number": self.to_int(record.get("version_number")),
-            "last_modified_datetime": self.to_datetime(record.get("last_modified_datetime")),
-            "published_year": self.to_int(record.get("published_year")),
-        }
@@ -1,10 +1,27 @@
 """Data validation utilities"""
 
+import math
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
+import numpy as np
+import pandas as pd
 
-@dataclass
+from src.transform._fast import FLOAT64_EXACT_LIMIT, range_mask
+
+# validate_batch screens batches at least this large column-by-column
+VECTORIZE_MIN_RECORDS = 100
+
+# Inferred pandas dtypes whose values pass each field_type check as-is
+_PASSING_TYPES: Dict[type, Set[str]] = {
+    str: {"string"},
+    int: {"integer"},
+    float: {"integer", "floating", "mixed-integer-float"},
+}
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of data validation"""
 
@@ -21,36 +38,68 @@ class FieldValidator:
         field_name: str,
         required: bool = False,
         field_type: Optional[type] = None,
-        allowed_values: Optional[Set[Any]] = None,
+        allowed_values: Optional[Iterable[Any]] = None,
         min_value: Optional[Any] = None,
         max_value: Optional[Any] = None,
         max_length: Optional[int] = None,
         custom_validator: Optional[Callable[[Any], bool]] = None,
         custom_message: Optional[str] = None,
     ):
-        self.field_name = field_name
+        # Interned: looked up in every record and used as a dict key in DataValidator
+        self.field_name = sys.intern(field_name)
         self.required = required
         self.field_type = field_type
-        self.allowed_values = allowed_values
+        # Frozen once so each membership test is a hash lookup, whatever was passed
+        self.allowed_values: Optional[FrozenSet[Any]] = (
+            frozenset(allowed_values) if allowed_values else None
+        )
         self.min_value = min_value
         self.max_value = max_value
         self.max_length = max_length
         self.custom_validator = custom_validator
         self.custom_message = custom_message
+        # Only the configured checks run per value, chosen once here
+        self._checks = self._build_checks()
 
     def validate(self, value: Any) -> ValidationResult:
         """Validate a field value"""
         errors: List[str] = []
         warnings: List[str] = []
+        self.check(value, errors, warnings)
+        return ValidationResult(
+            is_valid=len(errors) == 0,
+            errors=errors,
+            warnings=warnings,
+        )
 
+    def check(self, value: Any, errors: List[str], warnings: List[str]) -> None:
+        """Validate a field value, appending any messages to ``errors``/``warnings``"""
         # Check required
         if value is None:
             if self.required:
                 errors.append(f"Field '{self.field_name}' is required")
-            return ValidationResult(is_valid=len(errors) == 0, errors=errors)
+            return
+
+        for field_check in self._checks:
+            field_check(value, errors, warnings)
+
+    def _build_checks(self) -> Tuple[Callable[[Any, List[str], List[str]], None], ...]:
+        """Select, once, the checks this field is configured for"""
+        return tuple(
+            field_check
+            for enabled, field_check in (
+                (self.field_type, self._check_type),
+                (self.allowed_values, self._check_allowed),
+                (self.min_value is not None, self._check_min),
+                (self.max_value is not None, self._check_max),
+                (self.max_length, self._check_length),
+                (self.custom_validator, self._check_custom),
+            )
+            if enabled
+        )
 
-        # Check type
-        if self.field_type and not isinstance(value, self.field_type):
+    def _check_type(self, value: Any, errors: List[str], warnings: List[str]) -> None:
+        if not isinstance(value, self.field_type):
             # Try to convert numeric types
             if self.field_type in (int, float):
                 try:
@@ -60,48 +109,104 @@ class FieldValidator:
                         f"Field '{self.field_name}' must be of type {self.field_type.__name__}"
                     )
 
-        # Check allowed values
-        if self.allowed_values and value not in self.allowed_values:
+    def _check_allowed(self, value: Any, errors: List[str], warnings: List[str]) -> None:
+        if value not in self.allowed_values:
             errors.append(
-                f"Field '{self.field_name}' must be one of: {self.allowed_values}"
+                f"Field '{self.field_name}' must be one of: {set(self.allowed_values)}"
             )
 
-        # Check min/max values
-        if self.min_value is not None:
-            try:
-                if value < self.min_value:
-                    errors.append(
-                        f"Field '{self.field_name}' must be >= {self.min_value}"
-                    )
-            except TypeError:
-                pass
+    def _check_min(self, value: Any, errors: List[str], warnings: List[str]) -> None:
+        try:
+            if value < self.min_value:
+                errors.append(
+                    f"Field '{self.field_name}' must be >= {self.min_value}"
+                )
+        except TypeError:
+            pass
 
-        if self.max_value is not None:
-            try:
-                if value > self.max_value:
-                    errors.append(
-                        f"Field '{self.field_name}' must be <= {self.max_value}"
-                    )
-            except TypeError:
-                pass
+    def _check_max(self, value: Any, errors: List[str], warnings: List[str]) -> None:
+        try:
+            if value > self.max_value:
+                errors.append(
+                    f"Field '{self.field_name}' must be <= {self.max_value}"
+                )
+        except TypeError:
+            pass
 
-        # Check max length
-        if self.max_length and isinstance(value, str) and len(value) > self.max_length:
+    def _check_length(self, value: Any, errors: List[str], warnings: List[str]) -> None:
+        if isinstance(value, str) and len(value) > self.max_length:
             warnings.append(
                 f"Field '{self.field_name}' exceeds max length {self.max_length}"
             )
 
-        # Custom validator
-        if self.custom_validator and not self.custom_validator(value):
+    def _check_custom(self, value: Any, errors: List[str], warnings: List[str]) -> None:
+        if not self.custom_validator(value):
             errors.append(
                 self.custom_message or f"Field '{self.field_name}' failed custom validation"
             )
 
-        return ValidationResult(
-            is_valid=len(errors) == 0,
-            errors=errors,
-            warnings=warnings,
-        )
+    def screen(self, values: pd.Series) -> np.ndarray:
+        """Flag the values of a column that may fail validation or warn.
+
+        Vectorized and conservative: every value ``validate`` would report
+        on is flagged, though some flagged values may turn out valid.
+        """
+        present = np.not_equal(values.to_numpy(dtype=object), None)
+        flagged = ~present if self.required else np.zeros(len(values), dtype=bool)
+        if not present.any():
+            return flagged
+        if self.custom_validator:
+            return flagged | present
+
+        given = values[present]
+        inferred = pd.api.types.infer_dtype(given, skipna=False)
+        checks = np.zeros(len(given), dtype=bool)
+        if self.field_type and inferred not in _PASSING_TYPES.get(self.field_type, ()):
+            return flagged | present
+        if self.allowed_values:
+            if inferred not in ("string", "integer"):
+                return flagged | present
+            checks |= ~given.isin(list(self.allowed_values)).to_numpy()
+        if self.min_value is not None or self.max_value is not None:
+            numbers = self._exact_floats(given, inferred)
+            if numbers is not None:
+                lo = -math.inf if self.min_value is None else self.min_value
+                hi = math.inf if self.max_value is None else self.max_value
+                checks |= range_mask(numbers, lo, hi)
+            else:
+                try:
+                    # Object comparisons run element-wise with Python semantics
+                    if self.min_value is not None:
+                        checks |= np.less(given.to_numpy(), self.min_value).astype(bool)
+                    if self.max_value is not None:
+                        checks |= np.greater(given.to_numpy(), self.max_value).astype(bool)
+                except TypeError:
+                    # validate skips uncomparable values; let it decide per value
+                    return flagged | present
+        if self.max_length:
+            if inferred == "string":
+                checks |= (given.str.len() > self.max_length).to_numpy()
+            elif inferred != "integer" and inferred != "floating":
+                return flagged | present
+        flagged[present] = checks
+        return flagged
+
+    def _exact_floats(self, values: pd.Series, inferred: str) -> Optional[np.ndarray]:
+        """Return numeric values and bounds as float64 if that loses nothing, else None"""
+        if inferred not in ("integer", "floating", "mixed-integer-float"):
+            return None
+        bounds = [b for b in (self.min_value, self.max_value) if b is not None]
+        if not all(
+            type(b) is float or (type(b) is int and abs(b) < FLOAT64_EXACT_LIMIT) for b in bounds
+        ):
+            return None
+        try:
+            numbers = values.to_numpy(dtype=np.float64)
+        except OverflowError:
+            return None
+        if inferred != "floating" and np.nanmax(np.abs(numbers)) >= FLOAT64_EXACT_LIMIT:
+            return None
+        return numbers
 
 
 class DataValidator:
@@ -123,11 +228,10 @@ class DataValidator:
         all_errors: List[str] = []
         all_warnings: List[str] = []
 
+        # One pass with shared message lists; no per-field ValidationResult
+        get = record.get
         for field_name, validator in self.validators.items():
-            value = record.get(field_name)
-            result = validator.validate(value)
-            all_errors.extend(result.errors)
-            all_warnings.extend(result.warnings)
+            validator.check(get(field_name), all_errors, all_warnings)
 
         return ValidationResult(
             is_valid=len(all_errors) == 0,
@@ -138,8 +242,20 @@ class DataValidator:
     def validate_batch(
         self, records: List[Dict[str, Any]]
     ) -> Dict[int, ValidationResult]:
-        """Validate multiple records"""
-        results: Dict[int, ValidationResult] = {}
-        for i, record in enumerate(records):
-            results[i] = self.validate(record)
-        return results
+        """Validate multiple records.
+
+        Large batches are first screened column-by-column; only records a
+        field flags go through ``validate``, the rest are valid outright.
+        """
+        if len(records) < VECTORIZE_MIN_RECORDS or not self.validators:
+            return {i: self.validate(record) for i, record in enumerate(records)}
+
+        flagged = np.zeros(len(records), dtype=bool)
+        for field_name, validator in self.validators.items():
+            column = pd.Series([record.get(field_name) for record in records], dtype=object)
+            flagged |= validator.screen(column)
+
+        return {
+            i: self.validate(record) if needs_check else ValidationResult(True, [], [])
+            for i, (record, needs_check) in enumerate(zip(records, flagged.tolist(), strict=True))
+        }
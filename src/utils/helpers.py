@@ -1,52 +1,96 @@
 """Helper utilities for ETL Pipeline"""
 
 import re
-from datetime import datetime, date
-from typing import Any, Dict, List, Optional, Union
+import time
+from itertools import islice
+from datetime import datetime, date, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 import hashlib
 import json
 
+try:
+    import ciso8601
+except ImportError:  # ciso8601 is an optional accelerator (the "fast" extra)
+    ciso8601 = None
+
 
 def generate_record_hash(record: Dict[str, Any], fields: List[str]) -> str:
     """Generate a hash for a record based on specified fields"""
     values = [str(record.get(field, "")) for field in sorted(fields)]
     combined = "|".join(values)
-    return hashlib.md5(combined.encode()).hexdigest()
+    # Not security-sensitive; BLAKE2b is faster than MD5 and gives the same 32 hex chars
+    return hashlib.blake2b(combined.encode(), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _iso_second_prefix(epoch_seconds: int) -> str:
+    """Format the whole-second part of a UTC timestamp (cached per second)"""
+    return datetime.fromtimestamp(epoch_seconds, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def utc_now_iso() -> str:
+    """Get the current UTC time as a naive ISO-8601 string with microseconds"""
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    return f"{_iso_second_prefix(seconds)}.{nanoseconds // 1000:06d}"
+
+
+# Offset suffix stripped before ISO parsing; values are kept naive
+_TZ_RE = re.compile(r"\+\d{2}:\d{2}$")
+
+# ciso8601's C parser first when installed; fromisoformat still takes the
+# ISO forms it rejects (e.g. week dates)
+_ISO_PARSERS = (
+    (ciso8601.parse_datetime, datetime.fromisoformat)
+    if ciso8601 is not None
+    else (datetime.fromisoformat,)
+)
+
+# ciso8601 also reads partial and ordinal dates ("2024-01", "2024-015") that
+# fromisoformat rejects, so it only gets values starting with a full date
+_FULL_DATE_RE = re.compile(r"(?:\d{4}-\d{2}-\d{2}|\d{8})(?!\d)")
+
+_DATETIME_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%d/%m/%Y",
+    "%d/%m/%Y %H:%M:%S",
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime_str(value: str) -> Optional[datetime]:
+    """Parse a datetime string (cached: API data repeats a small set of dates)"""
+    # Handle timezone info, then try ISO format first
+    if "+" in value or value.endswith("Z"):
+        value = _TZ_RE.sub("", value).rstrip("Z")
+    parsers = _ISO_PARSERS if _FULL_DATE_RE.match(value) else _ISO_PARSERS[-1:]
+    for parse_iso in parsers:
+        try:
+            return parse_iso(value)
+        except ValueError:
+            pass
+
+    # Try common formats
+    for fmt in _DATETIME_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
 
 
 def parse_datetime(value: Any) -> Optional[datetime]:
     """Parse various datetime formats to datetime object"""
     if value is None:
         return None
+    if isinstance(value, str):
+        return _parse_datetime_str(value)
     if isinstance(value, datetime):
         return value
     if isinstance(value, date):
         return datetime.combine(value, datetime.min.time())
-    if isinstance(value, str):
-        # Try ISO format first
-        try:
-            # Handle timezone info
-            if "+" in value or value.endswith("Z"):
-                value = re.sub(r"\+\d{2}:\d{2}$", "", value)
-                value = value.rstrip("Z")
-            return datetime.fromisoformat(value)
-        except ValueError:
-            pass
-
-        # Try common formats
-        formats = [
-            "%Y-%m-%d",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d %H:%M:%S",
-            "%d/%m/%Y",
-            "%d/%m/%Y %H:%M:%S",
-        ]
-        for fmt in formats:
-            try:
-                return datetime.strptime(value, fmt)
-            except ValueError:
-                continue
-
     return None
 
 
@@ -69,6 +113,26 @@ def safe_get(data: Dict[str, Any], *keys: str, default: Any = None) -> Any:
     return result
 
 
+@lru_cache(maxsize=256)
+def make_getter(*keys: str, default: Any = None) -> Callable[[Dict[str, Any]], Any]:
+    """Build ``getter(data)`` equivalent to ``safe_get(data, *keys, default=default)``.
+
+    The key path is unrolled into straight-line code once, so hot call sites
+    skip the argument packing and loop of ``safe_get``. Getters are cached,
+    so ``keys`` and ``default`` must be hashable.
+    """
+    lines = ["def getter(data):"]
+    for i in range(len(keys)):
+        lines.append("    if not isinstance(data, dict):")
+        lines.append("        return default")
+        lines.append(f"    data = data.get(key{i}, default)")
+    lines.append("    return data")
+    namespace: Dict[str, Any] = {f"key{i}": key for i, key in enumerate(keys)}
+    namespace["default"] = default
+    exec(compile("\n".join(lines), f"<getter {'.'.join(map(str, keys))}>", "exec"), namespace)
+    return namespace["getter"]
+
+
 def flatten_dict(
     data: Dict[str, Any],
     prefix: str = "",
@@ -76,15 +140,23 @@ def flatten_dict(
 ) -> Dict[str, Any]:
     """Flatten nested dictionary"""
     items: Dict[str, Any] = {}
-    for key, value in data.items():
-        new_key = f"{prefix}{separator}{key}" if prefix else key
-        if isinstance(value, dict):
-            items.update(flatten_dict(value, new_key, separator))
-        elif isinstance(value, list):
-            # Convert lists to JSON string
-            items[new_key] = json.dumps(value)
+    # Iterative depth-first walk writing into one dict; each frame is a
+    # (key prefix, items iterator) pair, so key order matches recursion
+    stack = [(prefix, iter(data.items()))]
+    while stack:
+        key_prefix, entries = stack[-1]
+        for key, value in entries:
+            new_key = f"{key_prefix}{separator}{key}" if key_prefix else key
+            if isinstance(value, dict):
+                stack.append((new_key, iter(value.items())))
+                break
+            elif isinstance(value, list):
+                # Convert lists to JSON string
+                items[new_key] = json.dumps(value)
+            else:
+                items[new_key] = value
         else:
-            items[new_key] = value
+            stack.pop()
     return items
 
 
@@ -93,6 +165,13 @@ def chunk_list(data: List[Any], chunk_size: int) -> List[List[Any]]:
     return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
 
 
+def ichunk(data: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Lazily split any iterable into lists of up to ``chunk_size`` items"""
+    iterator = iter(data)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
 def sanitize_string(value: Any, max_length: Optional[int] = None) -> Optional[str]:
     """Sanitize string value for database storage"""
     if value is None:
@@ -113,16 +192,35 @@ def safe_float(value: Any, default: Optional[float] = None) -> Optional[float]:
         return default
 
 
+@lru_cache(maxsize=1024)
+def _int_from_str(value: str) -> Optional[int]:
+    """Parse an integer string like int(float(value)); None if it is not numeric"""
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
 def safe_int(value: Any, default: Optional[int] = None) -> Optional[int]:
     """Safely convert value to integer"""
     if value is None:
         return default
+    # JSON-decoded ints need no conversion; repeated numeric strings are cached
+    value_type = type(value)
+    if value_type is int:
+        return value
+    if value_type is str:
+        result = _int_from_str(value)
+        return default if result is None else result
     try:
         return int(float(value))
     except (ValueError, TypeError):
         return default
 
 
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "on"})
+
+
 def safe_bool(value: Any, default: bool = False) -> bool:
     """Safely convert value to boolean"""
     if value is None:
@@ -130,7 +228,7 @@ def safe_bool(value: Any, default: bool = False) -> bool:
     if isinstance(value, bool):
         return value
     if isinstance(value, str):
-        return value.lower() in ("true", "1", "yes", "on")
+        return value.lower() in _TRUE_STRINGS
     return bool(value)
 
 
@@ -144,23 +242,23 @@ def merge_dicts(*dicts: Dict[str, Any]) -> Dict[str, Any]:
 
 
 class Timer:
-    """Simple timer context manager"""
+    """Simple timer context manager (monotonic, nanosecond resolution)"""
 
     def __init__(self) -> None:
-        self.start_time: Optional[datetime] = None
-        self.end_time: Optional[datetime] = None
+        self.start_ns: Optional[int] = None
+        self.end_ns: Optional[int] = None
 
     def __enter__(self) -> "Timer":
-        self.start_time = datetime.utcnow()
+        self.start_ns = time.perf_counter_ns()
         return self
 
     def __exit__(self, *args: Any) -> None:
-        self.end_time = datetime.utcnow()
+        self.end_ns = time.perf_counter_ns()
 
     @property
     def elapsed_seconds(self) -> float:
         """Get elapsed time in seconds"""
-        if self.start_time is None:
+        if self.start_ns is None:
             return 0.0
-        end = self.end_time or datetime.utcnow()
-        return (end - self.start_time).total_seconds()
+        end = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end - self.start_ns) / 1e9
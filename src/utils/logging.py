@@ -1,15 +1,129 @@
 """Logging utilities with structured logging support"""
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+from contextvars import Token
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Mapping, Optional, Tuple
 
+import orjson
 import structlog
-from structlog.processors import JSONRenderer, TimeStamper
+from structlog.processors import JSONRenderer
+from structlog.typing import EventDict, WrappedLogger
+
+from src.utils.helpers import utc_now_iso
+
+# Thread that owns the real (blocking) handlers; callers only enqueue records
+_listener: Optional[QueueListener] = None
+# The handler setup_logging installed on the root logger
+_queue_handler: Optional[QueueHandler] = None
+
+# Arguments of the active setup_logging call; repeating them is a no-op
+_configured: Optional[Tuple[str, Optional[str], bool]] = None
+
+# Pending log file writes are flushed after this many seconds, and on every ERROR+
+LOG_FILE_FLUSH_INTERVAL = 1.0
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that leaves writes in the file buffer between flushes.
+
+    ``FileHandler`` flushes after every record, one write syscall each.
+    This flushes when an ERROR or worse arrives, on close, and from a
+    daemon thread every ``flush_interval`` seconds while unflushed
+    records are pending, so a quiet log still reaches the file.
+    """
+
+    def __init__(self, filename: str, flush_interval: float = LOG_FILE_FLUSH_INTERVAL):
+        super().__init__(filename)
+        self.flush_interval = flush_interval
+        self._pending = False
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="log-file-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self.flush_interval):
+            if self._pending:
+                self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            self._pending = False
+            super().flush()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+            return
+        if record.levelno >= logging.ERROR:
+            self.flush()
+        else:
+            self._pending = True
+
+    def close(self) -> None:
+        self._closed.set()
+        if self._flusher is not threading.current_thread():
+            self._flusher.join()
+        super().close()
+
+
+def _orjson_dumps(obj: Any, default: Any = None, **kwargs: Any) -> str:
+    """JSONRenderer serializer: orjson in C, decoded for the stdlib handlers"""
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _add_timestamp(logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
+    """Stamp records like ``TimeStamper(fmt="iso")``, reusing the formatted second"""
+    event_dict["timestamp"] = utc_now_iso() + "Z"
+    return event_dict
+
+
+def _stop_listener() -> None:
+    """Drain queued records, then close the handlers the listener owns"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+@lru_cache(maxsize=None)
+def _build_processors(json_format: bool) -> Tuple[Any, ...]:
+    """Build the structlog processor chain once per output format"""
+    shared_processors = (
+        structlog.contextvars.merge_contextvars,
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.add_logger_name,
+        _add_timestamp,
+        structlog.processors.UnicodeDecoder(),
+    )
 
-# Global logger cache
-_loggers: dict = {}
+    if json_format:
+        return shared_processors + (
+            structlog.processors.format_exc_info,
+            JSONRenderer(serializer=_orjson_dumps),
+        )
+    return shared_processors + (
+        structlog.processors.ExceptionPrettyPrinter(),
+        structlog.dev.ConsoleRenderer(colors=True),
+    )
 
 
 def setup_logging(
@@ -18,79 +132,68 @@ def setup_logging(
     json_format: bool = False,
 ) -> None:
     """Setup structured logging configuration"""
+    global _configured, _listener, _queue_handler
+    config = (log_level.upper(), log_file, json_format)
+    if config == _configured and _listener is not None:
+        return
 
     # Create logs directory if needed
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Configure standard library logging
+    # Configure standard library logging. The root logger only gets a
+    # QueueHandler; console/file writes happen on the listener thread, so
+    # logging never blocks the event loop on I/O.
     handlers = [logging.StreamHandler(sys.stdout)]
     if log_file:
-        handlers.append(logging.FileHandler(log_file))
-
-    logging.basicConfig(
-        format="%(message)s",
-        level=getattr(logging, log_level.upper()),
-        handlers=handlers,
-        force=True,
-    )
-
-    # Structlog processors
-    shared_processors = [
-        structlog.contextvars.merge_contextvars,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.add_logger_name,
-        TimeStamper(fmt="iso"),
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.UnicodeDecoder(),
-    ]
-
-    if json_format:
-        processors = shared_processors + [
-            structlog.processors.format_exc_info,
-            JSONRenderer(),
-        ]
-    else:
-        processors = shared_processors + [
-            structlog.processors.ExceptionPrettyPrinter(),
-            structlog.dev.ConsoleRenderer(colors=True),
-        ]
+        handlers.append(BufferedFileHandler(log_file))
+
+    # Swap out only our own handler: closing every root handler (as
+    # basicConfig(force=True) does) would also drop ones a host installed
+    _stop_listener()
+    root = logging.getLogger()
+    if _queue_handler is not None:
+        root.removeHandler(_queue_handler)
+        _queue_handler.close()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = QueueHandler(log_queue)
+    _queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    root.addHandler(_queue_handler)
+    root.setLevel(getattr(logging, config[0]))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    _configured = config
 
     structlog.configure(
-        processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        processors=list(_build_processors(json_format)),
+        # Calls below the level return before an event dict is even built
+        wrapper_class=structlog.make_filtering_bound_logger(getattr(logging, config[0])),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
-    """Get a structured logger instance"""
-    if name not in _loggers:
-        _loggers[name] = structlog.get_logger(name)
-    return _loggers[name]
+    """Get a structured logger instance (one per name)"""
+    return structlog.get_logger(name)
 
 
 class LogContext:
     """Context manager for adding temporary context to logs"""
 
+    __slots__ = ("context", "_tokens")
+
     def __init__(self, **kwargs: Any):
         self.context = kwargs
-        self._tokens: list = []
+        self._tokens: Mapping[str, Token] = {}
 
     def __enter__(self) -> "LogContext":
-        for key, value in self.context.items():
-            token = structlog.contextvars.bind_contextvars(**{key: value})
-            self._tokens.append((key, token))
+        # One bind for all keys; the tokens restore any outer values on exit
+        self._tokens = structlog.contextvars.bind_contextvars(**self.context)
         return self
 
     def __exit__(self, *args: Any) -> None:
-        for key, _ in self._tokens:
-            structlog.contextvars.unbind_contextvars(key)
-
-
-# Initialize with default settings
-setup_logging()
+        structlog.contextvars.reset_contextvars(**self._tokens)
@@ -1,5 +1,7 @@
 """Tests for ETL Pipeline"""
 
+import re
+
 import pytest
 from datetime import datetime
 
@@ -67,6 +69,23 @@ class TestHelpers:
         result = parse_datetime("2024-01-15T10:30:00+00:00")
         assert result is not None
 
+    def test_parse_datetime_rejects_partial_dates(self):
+        """Test partial and ordinal dates are not parsed"""
+        from src.utils.helpers import parse_datetime
+
+        assert parse_datetime("2024-01") is None
+        assert parse_datetime("2024-015") is None
+        assert parse_datetime("20240115") == datetime(2024, 1, 15)
+
+    def test_utc_now_iso(self):
+        """Test cached ISO timestamp formatting"""
+        from src.utils.helpers import parse_datetime, utc_now_iso
+
+        value = utc_now_iso()
+        assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}", value)
+        parsed = parse_datetime(value)
+        assert abs((datetime.utcnow() - parsed).total_seconds()) < 5
+
     def test_safe_float(self):
         """Test safe float conversion"""
         from src.utils.helpers import safe_float
@@ -94,6 +113,117 @@ class TestHelpers:
         assert chunks[1] == [3, 4]
         assert chunks[2] == [5]
 
+    def test_chunk_list_empty(self):
+        """Test chunking edge cases"""
+        from src.utils.helpers import chunk_list
+
+        assert chunk_list([], 3) == []
+        assert chunk_list([1, 2], 5) == [[1, 2]]
+
+    def test_timer(self):
+        """Test timer measures elapsed time"""
+        from src.utils.helpers import Timer
+
+        timer = Timer()
+        assert timer.elapsed_seconds == 0.0
+        with timer:
+            pass
+        elapsed = timer.elapsed_seconds
+        assert 0.0 <= elapsed < 1.0
+        assert timer.elapsed_seconds == elapsed
+
+    def test_ichunk(self):
+        """Test lazy chunking of any iterable"""
+        from src.utils.helpers import ichunk
+
+        chunks = ichunk(iter(range(5)), 2)
+        assert next(chunks) == [0, 1]
+        assert list(chunks) == [[2, 3], [4]]
+        assert list(ichunk([], 2)) == []
+
+    def test_make_getter(self):
+        """Test generated getters match safe_get"""
+        from src.utils.helpers import make_getter, safe_get
+
+        get_fixed_id = make_getter("clause", "fixed_id")
+        assert make_getter("clause", "fixed_id") is get_fixed_id
+        for data in ({"clause": {"fixed_id": 7}}, {"clause": {}}, {"clause": "x"}, {}, None):
+            assert get_fixed_id(data) == safe_get(data, "clause", "fixed_id")
+        assert make_getter("a", default=0)({}) == 0
+
+    def test_flatten_dict(self):
+        """Test nested dictionary flattening keeps key order"""
+        from src.utils.helpers import flatten_dict
+
+        data = {"a": 1, "b": {"c": 2, "d": {"e": [1, 2]}, "f": 3}, "g": 4}
+        result = flatten_dict(data)
+        assert list(result.items()) == [
+            ("a", 1), ("b_c", 2), ("b_d_e", "[1, 2]"), ("b_f", 3), ("g", 4)
+        ]
+        assert flatten_dict({"x": {"y": 1}}, prefix="p") == {"p_x_y": 1}
+
+
+class TestLogging:
+    """Tests for logging utilities"""
+
+    def test_buffered_file_handler(self, tmp_path):
+        """Test file logs are flushed on errors and on close, not per record"""
+        import logging
+
+        from src.utils.logging import BufferedFileHandler
+
+        log_file = tmp_path / "etl.log"
+        handler = BufferedFileHandler(str(log_file), flush_interval=60)
+        logger = logging.getLogger("test_buffered_file_handler")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+        try:
+            logger.info("first")
+            assert log_file.read_text() == ""
+            logger.error("second")
+            assert log_file.read_text() == "first\nsecond\n"
+            logger.info("third")
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+        assert log_file.read_text() == "first\nsecond\nthird\n"
+
+    def test_buffered_file_handler_flushes_when_idle(self, tmp_path):
+        """Test a lone record reaches the file once flush_interval passes"""
+        import logging
+        import time
+
+        from src.utils.logging import BufferedFileHandler
+
+        log_file = tmp_path / "etl.log"
+        handler = BufferedFileHandler(str(log_file), flush_interval=0.05)
+        logger = logging.getLogger("test_buffered_file_handler_flushes_when_idle")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+        try:
+            logger.info("only")
+            time.sleep(0.3)
+            assert log_file.read_text() == "only\n"
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+    def test_log_context_restores_outer_values(self):
+        """Test nested log contexts restore the enclosing values on exit"""
+        import structlog
+
+        from src.utils.logging import LogContext
+
+        with LogContext(job_id="outer"):
+            with LogContext(job_id="inner", step="extract"):
+                assert structlog.contextvars.get_contextvars() == {
+                    "job_id": "inner", "step": "extract"
+                }
+            assert structlog.contextvars.get_contextvars() == {"job_id": "outer"}
+        assert structlog.contextvars.get_contextvars() == {}
+
 
 class TestPipelineInterfaces:
     """Tests for pipeline interfaces"""
@@ -177,6 +307,173 @@ class TestTransformers:
         assert result["classification_fixed_id"] == 100
         assert result["award_code"] == "MA000001"
 
+    async def test_columnar_transform_matches_records(self):
+        """Test the batch transform gives the same output as transform_record"""
+        from src.core.interfaces import PipelineContext
+        from src.transform.transformers.wage_allowances import WageAllowancesTransformer
+
+        transformer = WageAllowancesTransformer()
+        context = PipelineContext(job_id="test")
+        records = [
+            {
+                "wage_allowance_fixed_id": "42",
+                "award_code": "  MA000001  ",
+                "clause_fixed_id": 3.9,
+                "clauses": "x" * 300,
+                "is_all_purpose": "yes",
+                "rate": "1.5",
+                "allowance_amount": 12,
+                "operative_from": "2024-07-01",
+                "last_modified_datetime": "2024-07-01T10:30:00Z",
+                "published_year": 2025,
+            },
+            {
+                "wage_allowance_fixed_id": None,
+                "award_code": 7,
+                "clause_fixed_id": "not a number",
+                "rate": "n/a",
+                "is_all_purpose": False,
+                "operative_from": "01/07/2024",
+            },
+            {},
+        ]
+
+        assert transformer.columnar
+        expected = [transformer.transform_record(record, context) for record in records]
+        assert transformer.transform_columns(records) == expected
+        assert await transformer.transform(records, context) == expected
+        assert expected[0]["wage_allowance_fixed_id"] == 42
+        assert expected[0]["clause_fixed_id"] == 3
+        assert len(expected[0]["clauses"]) == 200
+        assert expected[1]["award_code"] == "7"
+
+    def test_convert_column_matches_converter(self):
+        """Test column conversion treats NaN and big ints like the row path"""
+        import math
+
+        import pandas as pd
+
+        from src.transform.base_transformer import BaseTransformer
+
+        values = [
+            None, float("nan"), "nan", 7, 2**53 + 1, -(2**63) - 5, 2.9, " 3.5 ", "abc", True,
+        ]
+
+        def normalized(items):
+            return [
+                "NaN" if isinstance(item, float) and math.isnan(item) else (type(item), item)
+                for item in items
+            ]
+
+        for kind in ("int", "float", "str", "datetime", "bool"):
+            convert = BaseTransformer.converter(kind)
+            column = BaseTransformer.convert_column(pd.Series(values, dtype=object), kind)
+            assert normalized(column) == normalized(map(convert, values)), kind
+
+    def test_transform_table(self):
+        """Test the Arrow table output matches the row output"""
+        pa = pytest.importorskip("pyarrow")
+        from src.transform.transformers.awards import AwardsTransformer
+
+        transformer = AwardsTransformer()
+        records = [{"award_id": "1", "code": " MA1 ", "award_operative_from": "2024-07-01"}, {}]
+        table = transformer.transform_table(records)
+        assert table.schema.field("award_id").type == pa.int64()
+        assert table.to_pylist() == transformer.transform_columns(records)
+
+    def test_transform_batches(self):
+        """Test Arrow record batches are cut to the requested size"""
+        pytest.importorskip("pyarrow")
+        from src.transform.transformers.awards import AwardsTransformer
+
+        transformer = AwardsTransformer()
+        records = [{"award_id": i, "code": f"MA{i}"} for i in range(5)]
+        batches = list(transformer.transform_batches(records, batch_size=2))
+        assert [batch.num_rows for batch in batches] == [2, 2, 1]
+        rows = [row for batch in batches for row in batch.to_pylist()]
+        assert rows == transformer.transform_columns(records)
+
+    def test_transform_rows(self):
+        """Test tuple output follows COLUMN_TYPES order"""
+        from src.transform.transformers.awards import AwardsTransformer
+
+        transformer = AwardsTransformer()
+        records = [{"award_id": "1", "code": " MA1 "}, {"name": "Award"}]
+        rows = transformer.transform_rows(records)
+        assert all(isinstance(row, tuple) for row in rows)
+        fields = [field for field, _, _ in transformer.COLUMN_TYPES]
+        assert [dict(zip(fields, row, strict=True)) for row in rows] == transformer.transform_columns(records)
+
+    def test_custom_transform_record_is_kept(self):
+        """Test generated transform_record never replaces a hand-written one"""
+        from src.core.interfaces import PipelineContext
+        from src.transform.transformers.awards import AwardsTransformer
+
+        class UpperCodeTransformer(AwardsTransformer):
+            def transform_record(self, record, context):
+                result = super().transform_record(record, context)
+                result["code"] = result["code"].upper()
+                return result
+
+        transformer = UpperCodeTransformer()
+        assert not transformer.columnar
+        assert AwardsTransformer().columnar
+        result = transformer.transform_record({"code": "ma1"}, PipelineContext(job_id="test"))
+        assert result["code"] == "MA1"
+
+    async def test_parallel_transform_keeps_order(self):
+        """Test chunked parallel transform returns records in input order"""
+        from src.core.interfaces import PipelineContext
+        from src.transform.transformers.awards import AwardsTransformer
+
+        context = PipelineContext(job_id="test")
+        records = [{"award_id": i, "code": f"MA{i:06d}"} for i in range(7)]
+
+        serial = await AwardsTransformer().transform(records, context)
+        parallel = await AwardsTransformer(parallelism=3, chunk_size=2).transform(records, context)
+        assert parallel == serial
+        assert [r["award_id"] for r in parallel] == list(range(7))
+
+    async def test_transform_validates_batch(self):
+        """Test batch validation skips invalid records and isolates failing checks"""
+        from src.core.interfaces import PipelineContext
+        from src.transform.transformers.awards import AwardsTransformer
+        from src.transform.validators import DataValidator, FieldValidator
+
+        def not_thirteen(value):
+            if value == 13:
+                raise ValueError("unlucky")
+            return True
+
+        context = PipelineContext(job_id="test")
+        records = [{"award_id": i, "code": f"MA{i}"} for i in range(150)]
+        records[5] = {"award_id": 5}
+
+        validator = DataValidator([FieldValidator("code", required=True)])
+        transformed = await AwardsTransformer(validator=validator).transform(records, context)
+        assert len(transformed) == 149
+        assert 5 not in [r["award_id"] for r in transformed]
+
+        validator.add_validator(FieldValidator("award_id", custom_validator=not_thirteen))
+        transformed = await AwardsTransformer(validator=validator).transform(records, context)
+        assert [r["award_id"] for r in transformed] == [i for i in range(150) if i not in (5, 13)]
+
+    async def test_transform_stream_batches(self):
+        """Test streaming transform yields bounded micro-batches covering every record"""
+        from src.core.interfaces import PipelineContext
+        from src.transform.transformers.awards import AwardsTransformer
+
+        context = PipelineContext(job_id="test")
+
+        async def source():
+            for i in range(5):
+                yield {"award_id": i}
+
+        transformer = AwardsTransformer()
+        batches = [batch async for batch in transformer.transform_stream(source(), context, batch_size=2)]
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [r["award_id"] for batch in batches for r in batch] == list(range(5))
+
 
 class TestValidators:
     """Tests for data validators"""
@@ -210,3 +507,242 @@ class TestValidators:
         invalid_record = {"id": 1}
         result = validator.validate(invalid_record)
         assert not result.is_valid
+
+    def test_validate_batch_matches_validate(self):
+        """Test screened batch validation gives the same results as per-record validation"""
+        from src.transform.validators import DataValidator, FieldValidator
+
+        validator = DataValidator([
+            FieldValidator("id", required=True, field_type=int, min_value=0),
+            FieldValidator("name", field_type=str, max_length=5),
+            FieldValidator("kind", allowed_values={"a", "b"}),
+        ])
+        records = [{"id": i, "name": f"n{i}", "kind": "ab"[i % 2]} for i in range(150)]
+        records[3] = {"name": "n3"}
+        records[7]["id"] = -7
+        records[11]["name"] = "too long"
+        records[12]["kind"] = "c"
+        records[20]["id"] = "20"
+
+        results = validator.validate_batch(records)
+        assert results == {i: validator.validate(record) for i, record in enumerate(records)}
+        assert [i for i, result in results.items() if not result.is_valid] == [3, 7, 12]
+        assert results[11].warnings
+
+
+class TestPipelineExecution:
+    """Tests for pipeline execution"""
+
+    async def test_step_complete_callback(self):
+        """Test step callbacks fire once per step, sync or async"""
+        from src.core.interfaces import PipelineStep, StepResult, StepStatus
+        from src.core.pipeline import Pipeline
+
+        class CountStep(PipelineStep):
+            def __init__(self, step_name: str):
+                self._name = step_name
+
+            @property
+            def name(self) -> str:
+                return self._name
+
+            async def execute(self, context):
+                return StepResult(status=StepStatus.COMPLETED, records_processed=3)
+
+        seen = []
+
+        async def record_step(step_name, step_result):
+            seen.append((step_name, step_result.records_processed))
+
+        pipeline = Pipeline(name="test", steps=[CountStep("a"), CountStep("b")])
+        pipeline.on_step_complete(record_step)
+        pipeline.on_step_complete(lambda step_name, step_result: 1 / 0)
+
+        result = await pipeline.execute(job_id="job-1")
+        assert result.status == StepStatus.COMPLETED
+        assert seen == [("a", 3), ("b", 3)]
+
+
+class TestETLPipeline:
+    """Tests for the ETL pipeline orchestrator"""
+
+    def test_job_name_is_bounded(self):
+        """Test job names list a few award codes but summarize long lists"""
+        from src.orchestrator.pipeline import ETLPipeline
+
+        pipeline = ETLPipeline(connector=object(), state_manager=object(), award_codes=["MA000001"])
+        assert pipeline.award_codes == ("MA000001",)
+        assert pipeline._job_name().startswith("fwc_awards_etl:MA000001:")
+
+        codes = [f"MA{i:06d}" for i in range(1000)]
+        name = pipeline._job_name(codes)
+        assert name.startswith("fwc_awards_etl:1000codes_")
+        assert len(name) < 80
+        assert name.split(":")[1] == pipeline._job_name(codes).split(":")[1]
+
+
+class TestScheduler:
+    """Tests for the job scheduler"""
+
+    async def test_restart_keeps_stored_next_run_time(self, tmp_path, monkeypatch):
+        """Test re-adding a persisted job keeps its stored next_run_time"""
+        from datetime import timezone
+
+        from src.config.settings import Settings
+        from src.orchestrator import scheduler as scheduler_module
+        from src.utils.helpers import utc_now_iso
+
+        settings = Settings(sqlite_database_path=str(tmp_path / "state.db"))
+        monkeypatch.setattr(scheduler_module, "get_settings", lambda: settings)
+        stored_run = datetime(2030, 6, 1, tzinfo=timezone.utc)
+
+        first = scheduler_module.Scheduler(run_job_func=utc_now_iso)
+        first.add_cron_job("0 2 * * *")
+        first.start()
+        first._scheduler.modify_job("etl_scheduled_job", next_run_time=stored_run)
+        first.stop()
+
+        second = scheduler_module.Scheduler(run_job_func=utc_now_iso)
+        second.add_cron_job("0 2 * * *")
+        second.start()
+        try:
+            (job,) = second.get_jobs()
+            assert job.next_run_time == stored_run
+            second.add_cron_job("0 3 * * *")
+            assert second.get_jobs()[0].next_run_time != stored_run
+        finally:
+            second.stop()
+
+
+class TestStateManager:
+    """Tests for the SQLite state manager"""
+
+    async def test_create_jobs_batch(self, tmp_path):
+        """Test batch job creation inserts new jobs and resets existing ones"""
+        from src.orchestrator.state_manager import StateManager
+
+        sm = StateManager(str(tmp_path / "state.db"))
+        await sm.initialize()
+        await sm.create_job("job-1", name="old", status="failed")
+
+        count = await sm.create_jobs([("job-1", "first", "pending"), ("job-2", None, "pending")])
+        assert count == 2
+        assert await sm.get_job_count(status="pending") == 2
+        job = await sm.get_job("job-1")
+        assert job["name"] == "first"
+        assert (await sm.get_job("job-2"))["name"] == "job-2"
+        await sm.close()
+
+    async def test_save_job_result_with_steps(self, tmp_path):
+        """Test saving a pipeline result stores the summary and every step"""
+        from src.core.interfaces import StepResult, StepStatus
+        from src.core.pipeline import PipelineResult
+        from src.orchestrator.state_manager import StateManager
+
+        sm = StateManager(str(tmp_path / "state.db"))
+        await sm.initialize()
+        await sm.create_job("job-1", status="running")
+
+        now = datetime.utcnow()
+        result = PipelineResult(
+            job_id="job-1",
+            status=StepStatus.COMPLETED,
+            start_time=now,
+            end_time=now,
+            total_records_processed=7,
+            step_results={
+                "extract": StepResult(StepStatus.COMPLETED, 7, start_time=now, end_time=now),
+                "load": StepResult(StepStatus.SKIPPED),
+            },
+        )
+        await sm.save_job_result("job-1", result)
+
+        job = await sm.get_job("job-1")
+        assert job["status"] == "completed"
+        assert job["total_records"] == 7
+        steps = await sm.get_job_steps("job-1")
+        assert [(s["step_name"], s["status"]) for s in steps] == [
+            ("extract", "completed"),
+            ("load", "skipped"),
+        ]
+        assert steps[0]["start_time"] == now.isoformat()
+        assert steps[1]["start_time"] is None
+        await sm.close()
+
+    async def test_recent_job_stats_rollup(self, tmp_path):
+        """Test the daily stats roll-up follows inserts, status changes and deletes"""
+        from src.orchestrator.state_manager import StateManager
+
+        sm = StateManager(str(tmp_path / "state.db"))
+        await sm.initialize()
+        await sm.create_jobs([("job-1", None, "pending"), ("job-2", None, "pending")])
+        await sm.create_job("job-3", status="running")
+        await sm.update_job_completion("job-3", "completed", total_records=10)
+        await sm.cleanup_pending_jobs()
+        await sm.delete_job("job-2")
+
+        stats = await sm.get_recent_job_stats(days=7)
+        assert stats == {
+            "total": 2,
+            "by_status": {"completed": 1, "failed": 1},
+            "total_records": 10,
+        }
+        await sm.close()
+
+    async def test_list_jobs_page_keyset(self, tmp_path):
+        """Test keyset pagination walks every job exactly once, newest first"""
+        from src.orchestrator.state_manager import StateManager
+
+        sm = StateManager(str(tmp_path / "state.db"))
+        await sm.initialize()
+        await sm.create_jobs([(f"job-{i}", None, "pending") for i in range(5)])
+
+        seen = []
+        cursor = None
+        while True:
+            jobs, cursor = await sm.list_jobs_page(limit=2, cursor=cursor)
+            seen.extend(job["job_id"] for job in jobs)
+            if cursor is None:
+                break
+        assert seen == [f"job-{i}" for i in reversed(range(5))]
+        assert seen[:2] == [job["job_id"] for job in await sm.list_jobs(limit=2)]
+
+        with pytest.raises(ValueError):
+            await sm.list_jobs_page(cursor="not-a-cursor")
+        await sm.close()
+
+    async def test_worker_batch_isolates_failures(self, tmp_path):
+        """Test a failing operation in a batch does not roll back its neighbours"""
+        import asyncio
+        import sqlite3
+
+        from src.orchestrator.state_manager import StateManager
+
+        sm = StateManager(str(tmp_path / "state.db"))
+        await sm.initialize()
+
+        results = await asyncio.gather(
+            sm.create_job("job-1"),
+            sm._execute("INSERT INTO missing_table VALUES (1)"),
+            sm.create_job("job-2"),
+            return_exceptions=True,
+        )
+        assert isinstance(results[1], sqlite3.OperationalError)
+        assert await sm.get_job_count() == 2
+        await sm.close()
+
+    async def test_job_logs_are_buffered(self, tmp_path):
+        """Test buffered and batched job logs are all stored, in order"""
+        from src.orchestrator.state_manager import StateManager
+
+        sm = StateManager(str(tmp_path / "state.db"))
+        await sm.initialize()
+        await sm.create_job("job-1")
+
+        await sm.add_job_log("job-1", "INFO", "first")
+        await sm.add_job_logs_batch("job-1", [("INFO", "second"), ("ERROR", "third")])
+        await sm.add_job_log("job-1", "INFO", "fourth")
+
+        logs = await sm.get_job_logs("job-1")
+        assert [log["message"] for log in logs] == ["first", "second", "third", "fourth"]
+        await sm.close()